@@ -1,4 +1,4 @@
-from lib.oven import Profile, Segment
+from lib.oven import Profile, Segment, RateMode
 import os
 import json
 import pytest
@@ -86,6 +86,25 @@ class TestSegment:
         assert cool_seg.is_natural_cool() == True
         assert normal_seg.is_natural_cool() == False
     
+    def test_rate_mode(self):
+        assert Segment(100, 500).rate_mode == RateMode.NUMERIC
+        assert Segment(0, 500, hold=60).rate_mode == RateMode.NUMERIC
+        assert Segment("max", 1000).rate_mode == RateMode.MAX
+        assert Segment("cool", 200).rate_mode == RateMode.COOL
+        assert Segment("MAX", 200).rate_mode == RateMode.COOL
+    
+    def test_unknown_string_rate_loads(self):
+        profile = Profile(json.dumps({
+            "name": "test-unknown-rate",
+            "version": 2,
+            "start_temp": 1000,
+            "segments": [{"rate": "slow", "target": 200, "hold": 0}]
+        }))
+        assert profile.segments[0].is_natural_cool()
+        assert profile.get_rate_mode_for_segment(0) == RateMode.COOL
+        assert profile.get_rate_mode_for_segment(1) == RateMode.NUMERIC
+        assert profile.get_duration() > 0
+    
     def test_validate_positive_rate_increasing_temp(self):
         seg = Segment(100, 500)
         # Should not raise
@@ -153,11 +172,44 @@ class TestProfileV2:
         assert legacy[0] == [0, 65]  # Start point
         assert len(legacy) >= 4  # At least start + 3 ramp endpoints + 1 hold endpoint
     
+    def test_to_legacy_format_cached(self):
+        profile = get_v2_profile()
+        assert profile.to_legacy_format() is profile.data
+        adjusted = profile.to_legacy_format(start_temp=80, from_segment=1)
+        assert adjusted[0] == [0, 80]
+        assert profile.to_legacy_format(start_temp=80, from_segment=1) is adjusted
+        assert profile.to_legacy_format(start_temp=80) is not adjusted
+    
     def test_get_duration(self):
         profile = get_v2_profile()
         duration = profile.get_duration()
         assert duration > 0
-    
+
+    def test_segment_tables(self):
+        profile = get_v2_profile()
+        assert profile.seconds_per_degree == [36, 72, 18]
+        assert profile.hold_seconds == [0, 3600, 0]
+
+    def test_ramp_complete(self):
+        profile = Profile(json.dumps({
+            "name": "test-directions",
+            "version": 2,
+            "start_temp": 100,
+            "segments": [
+                {"rate": "max", "target": 500, "hold": 0},
+                {"rate": 0, "target": 500, "hold": 10},
+                {"rate": -100, "target": 200, "hold": 0},
+            ]
+        }))
+        # heating completes within tolerance below the target
+        assert profile.ramp_complete(0, 494) == False
+        assert profile.ramp_complete(0, 495) == True
+        # pure holds are always complete
+        assert profile.ramp_complete(1, 0) == True
+        # cooling completes within tolerance above the target
+        assert profile.ramp_complete(2, 206) == False
+        assert profile.ramp_complete(2, 205) == True
+
     def test_get_target_temperature(self):
         profile = get_v2_profile()
         # At time 0, should be start temp
@@ -287,6 +339,15 @@ class TestProfileBackwardCompatibility:
         
         temperature = profile.get_target_temperature(6004)
         assert temperature == 801.0
+
+    def test_get_target_temperature_reuses_line(self):
+        profile = get_profile()
+
+        # walking forward and then back across segments gives the
+        # same answers as a fresh profile
+        times = [3000, 3001, 6004, 6005, 3000, 0]
+        expected = [get_profile().get_target_temperature(t) for t in times]
+        assert [profile.get_target_temperature(t) for t in times] == expected
     
     def test_find_time_from_temperature(self):
         profile = get_profile()
@@ -0,0 +1,129 @@
+import logging
+import pytest
+import lib.oven
+from lib.oven import DupFilter, Oven
+
+
+def record(msg):
+    return logging.LogRecord("test", logging.ERROR, __file__, 0, msg, None, None)
+
+
+# =============================================================================
+# Test DupFilter
+# =============================================================================
+
+class TestDupFilter:
+
+    def test_suppresses_repeats(self):
+        f = DupFilter()
+        assert f.filter(record("open thermocouple")) is True
+        assert f.filter(record("open thermocouple")) is False
+        assert f.filter(record("short circuit")) is True
+
+    def test_memory_is_bounded(self):
+        f = DupFilter(maxsize=3)
+        for i in range(10):
+            f.filter(record("msg %d" % i))
+        assert len(f.msgs) == 3
+        # the oldest messages were evicted and are logged again
+        assert f.filter(record("msg 0")) is True
+        assert f.filter(record("msg 9")) is False
+
+    def test_repeat_refreshes_message(self):
+        f = DupFilter(maxsize=2)
+        f.filter(record("a"))
+        f.filter(record("b"))
+        f.filter(record("a"))
+        f.filter(record("c"))
+        # "b" was least recently seen, so it was evicted instead of "a"
+        assert f.filter(record("a")) is False
+        assert f.filter(record("b")) is True
+
+
+# =============================================================================
+# Test Oven.sleep_until_next_tick
+# =============================================================================
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeWake:
+    '''stands in for the event that wakes the loop early, never set here'''
+    def __init__(self, clock):
+        self.clock = clock
+
+    def wait(self, timeout):
+        self.clock.now += timeout
+        return False
+
+    def clear(self):
+        pass
+
+
+class TickingOven:
+    '''just the state sleep_until_next_tick uses'''
+    sleep_until_next_tick = Oven.sleep_until_next_tick
+
+    def __init__(self, clock, time_step=2):
+        self.time_step = time_step
+        self._tick_now = clock.now
+        self._next_tick = None
+        self._tick_duty = 0
+        self._wake = FakeWake(clock)
+
+    def get_loop_sleep_time(self):
+        return self.time_step
+
+
+class TestSleepUntilNextTick:
+
+    def test_work_in_the_tick_does_not_stretch_the_period(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(lib.oven.time, "monotonic", clock.monotonic)
+        monkeypatch.setattr(lib.oven.time, "sleep", clock.sleep)
+        oven = TickingOven(clock)
+        clock.now += 0.5  # the tick's own work
+        oven.sleep_until_next_tick()
+        assert clock.now == 102.0
+
+    def test_relay_duty_cycle_is_added_to_the_period(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(lib.oven.time, "monotonic", clock.monotonic)
+        monkeypatch.setattr(lib.oven.time, "sleep", clock.sleep)
+        oven = TickingOven(clock)
+        # a real oven spends time_step driving the relays, then rests
+        # time_step with them off
+        clock.now += 2
+        oven._tick_duty = 2
+        oven.sleep_until_next_tick()
+        assert clock.now == 104.0
+        assert oven._tick_duty == 0
+
+    def test_deadlines_do_not_drift(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(lib.oven.time, "monotonic", clock.monotonic)
+        monkeypatch.setattr(lib.oven.time, "sleep", clock.sleep)
+        oven = TickingOven(clock)
+        for i in range(5):
+            clock.now += 0.3
+            oven.sleep_until_next_tick()
+        assert clock.now == pytest.approx(110.0)
+
+    def test_restarts_schedule_when_far_behind(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(lib.oven.time, "monotonic", clock.monotonic)
+        monkeypatch.setattr(lib.oven.time, "sleep", clock.sleep)
+        oven = TickingOven(clock)
+        clock.now += 7  # stalled for several ticks
+        oven.sleep_until_next_tick()
+        # no sleep, the next tick runs straight away on a fresh schedule
+        assert clock.now == 107.0
+        assert oven._next_tick == 107.0
@@ -0,0 +1,164 @@
+import sys
+import os
+import json
+import pytest
+from unittest.mock import MagicMock
+
+# Add lib/ to path so we can import ovenWatcher
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+
+from ovenWatcher import OvenWatcher
+
+
+class FakeOven:
+    '''an idle oven, the watcher thread just sleeps on it'''
+    state = "IDLE"
+    time_step = 3600
+    current_segment_index = 0
+
+    def get_state(self):
+        return {"state": "RUNNING", "temperature": 70}
+
+
+class FakeProfile:
+    name = "test"
+    start_temp = 60
+    segments = []
+    data = [[0, 60], [3600, 1000]]
+
+
+class FakeSocket:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+
+    def send(self, message):
+        if self.fail:
+            raise IOError("socket closed")
+        self.sent.append(json.loads(message))
+
+
+@pytest.fixture
+def watcher():
+    return OvenWatcher(FakeOven())
+
+
+# =============================================================================
+# Test notify_all
+# =============================================================================
+
+class TestNotifyAll:
+
+    def test_sends_to_every_observer(self, watcher):
+        sockets = [FakeSocket(), FakeSocket()]
+        watcher.observers.extend(sockets)
+        watcher.notify_all({"state": "IDLE"})
+        assert [s.sent for s in sockets] == [[{"state": "IDLE"}]] * 2
+
+    def test_drops_dead_sockets_in_place(self, watcher):
+        good, other = FakeSocket(), FakeSocket()
+        dead = FakeSocket(fail=True)
+        observers = watcher.observers
+        observers.extend([good, dead, other, dead])
+        watcher.notify_all({"state": "IDLE"})
+        assert watcher.observers is observers
+        assert watcher.observers == [good, other]
+        assert len(good.sent) == 1
+
+    def test_no_observers(self, watcher):
+        watcher.notify_all({"state": "IDLE"})
+        assert watcher.observers == []
+
+
+# =============================================================================
+# Test log_state
+# =============================================================================
+
+class TestLogState:
+
+    def test_keeps_every_state_below_the_bound(self, watcher):
+        watcher.last_log_max = 10
+        for i in range(10):
+            watcher.log_state({"runtime": i})
+        assert [s["runtime"] for s in watcher.last_log] == list(range(10))
+        assert watcher.log_every == 1
+
+    def test_halves_resolution_past_the_bound(self, watcher):
+        watcher.last_log_max = 10
+        for i in range(11):
+            watcher.log_state({"runtime": i})
+        assert [s["runtime"] for s in watcher.last_log] == [0, 2, 4, 6, 8, 10]
+        assert watcher.log_every == 2
+        # from now on only every 2nd state is kept
+        for i in range(11, 15):
+            watcher.log_state({"runtime": i})
+        assert [s["runtime"] for s in watcher.last_log][-2:] == [12, 14]
+
+    def test_stays_bounded_and_covers_the_run(self, watcher):
+        watcher.last_log_max = 100
+        for i in range(10000):
+            watcher.log_state({"runtime": i})
+        assert len(watcher.last_log) <= 100
+        assert watcher.last_log[0]["runtime"] == 0
+        assert watcher.last_log[-1]["runtime"] > 9800
+        assert watcher.log_every == 128
+
+    def test_record_resets_the_stride(self, watcher):
+        watcher.last_log_max = 10
+        for i in range(50):
+            watcher.log_state({"runtime": i})
+        watcher.record(FakeProfile())
+        assert watcher.log_every == 1
+        assert watcher.log_skipped == 0
+        assert len(watcher.last_log) == 1
+
+
+# =============================================================================
+# Test broadcast_state
+# =============================================================================
+
+def idle_state(temperature=70.0):
+    return {"state": "IDLE", "temperature": temperature, "target": 0, "heat": 0}
+
+
+class TestBroadcastState:
+
+    def test_unchanged_idle_state_waits_for_heartbeat(self, watcher):
+        sock = FakeSocket()
+        watcher.observers.append(sock)
+        for i in range(watcher.heartbeat_ticks):
+            watcher.broadcast_state(idle_state())
+        assert len(sock.sent) == 1
+        # heartbeat_ticks after the last send it goes out again
+        watcher.broadcast_state(idle_state())
+        assert len(sock.sent) == 2
+
+    def test_changed_idle_state_is_sent(self, watcher):
+        sock = FakeSocket()
+        watcher.observers.append(sock)
+        watcher.broadcast_state(idle_state(70.0))
+        watcher.broadcast_state(idle_state(70.01))
+        watcher.broadcast_state(idle_state(71.0))
+        assert [s["temperature"] for s in sock.sent] == [70.0, 71.0]
+
+    def test_zone_temperatures_are_compared(self, watcher):
+        sock = FakeSocket()
+        watcher.observers.append(sock)
+        for zone_temp in (70.0, 75.0):
+            state = idle_state()
+            state["zones"] = [{"temperature": 70.0}, {"temperature": zone_temp}]
+            watcher.broadcast_state(state)
+        assert len(sock.sent) == 2
+
+    def test_running_state_is_always_sent(self, watcher):
+        sock = FakeSocket()
+        watcher.observers.append(sock)
+        for i in range(3):
+            watcher.broadcast_state({"state": "RUNNING", "temperature": 70.0})
+        assert len(sock.sent) == 3
+
+    def test_mqtt_gets_skipped_states(self, watcher):
+        watcher.mqtt_client = MagicMock()
+        for i in range(3):
+            watcher.broadcast_state(idle_state())
+        assert watcher.mqtt_client.publish_state.call_count == 3
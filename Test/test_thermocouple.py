@@ -0,0 +1,86 @@
+import struct
+import pytest
+from lib.oven import max31855_linearize, Max31855_Error, TempTracker
+from lib.oven import max31856_fault_name
+
+
+def frame(tc_celsius, cj_celsius, fault_bits=0):
+    '''build a raw MAX31855 frame the way the chip lays it out'''
+    tc_word = int(round(tc_celsius * 4)) << 2
+    cj_word = int(round(cj_celsius * 16)) << 4
+    rx = bytearray(struct.pack(">hh", tc_word, cj_word))
+    rx[3] |= fault_bits
+    return rx
+
+
+# =============================================================================
+# Test max31855_linearize()
+# =============================================================================
+
+class TestMax31855Linearize:
+
+    def test_room_temperature(self):
+        assert max31855_linearize(frame(25, 25)) == pytest.approx(25.0, abs=0.1)
+
+    def test_matches_nist_at_firing_temperatures(self):
+        # reference values from adafruit_max31855.temperature_NIST
+        assert max31855_linearize(frame(100, 25)) == pytest.approx(99.9619, abs=1e-3)
+        assert max31855_linearize(frame(1000, 25)) == pytest.approx(999.1753, abs=1e-3)
+
+    def test_negative_cold_junction(self):
+        assert max31855_linearize(frame(-10, -10)) == pytest.approx(-10.0, abs=0.1)
+
+    def test_open_thermocouple(self):
+        with pytest.raises(Max31855_Error) as exc:
+            max31855_linearize(frame(25, 25, 0x01))
+        assert exc.value.message == "not connected"
+
+    def test_short_to_ground(self):
+        with pytest.raises(Max31855_Error) as exc:
+            max31855_linearize(frame(25, 25, 0x02))
+        assert exc.value.message == "short circuit"
+
+    def test_short_to_power(self):
+        with pytest.raises(Max31855_Error) as exc:
+            max31855_linearize(frame(25, 25, 0x04))
+        assert exc.value.message == "short circuit"
+
+    def test_faulty_reading(self):
+        rx = frame(25, 25)
+        rx[1] |= 0x01
+        with pytest.raises(Max31855_Error):
+            max31855_linearize(rx)
+
+
+# =============================================================================
+# Test TempTracker
+# =============================================================================
+
+class TestTempTracker:
+
+    def test_window_is_bounded(self):
+        tracker = TempTracker()
+        for t in range(tracker.size * 3):
+            tracker.add(t)
+        assert len(tracker.temps) == tracker.size
+        assert tracker.temps[-1] == tracker.size * 3 - 1
+
+
+# =============================================================================
+# Test max31856_fault_name()
+# =============================================================================
+
+class TestMax31856FaultName:
+
+    def test_no_fault(self):
+        assert max31856_fault_name(0) is None
+
+    def test_single_faults(self):
+        assert max31856_fault_name(0x01) == "open_tc"
+        assert max31856_fault_name(0x02) == "voltage"
+        assert max31856_fault_name(0x80) == "cj_range"
+
+    def test_reports_highest_bit_first(self):
+        # same precedence as iterating the adafruit fault dict
+        assert max31856_fault_name(0x41) == "tc_range"
+        assert max31856_fault_name(0xFF) == "cj_range"
@@ -151,6 +151,10 @@ seek_start = True
 # temperature_average_samples times during and the average value is used.
 sensor_time_wait = 2
 
+# While idle, the controller checks the kiln every N seconds to track
+# cooling. Starting or stopping a run wakes it immediately.
+idle_poll_interval = 10
+
 
 ########################################################################
 #
@@ -416,6 +420,11 @@ runaway_min_temp_rise = 10 # degrees
 # (Prevents SD card wear from constant writing)
 state_save_interval = 60 # seconds
 
+# Force state.json to disk with fsync on every save. The atomic rename
+# already keeps the file from being corrupted; fsync only guards the
+# latest save against power loss and costs a full flush of the SD card.
+fsync_state_file = False
+
 ########################################################################
 # MQTT Integration (optional)
 # Publishes kiln status and accepts limited commands (stop/pause/resume).
@@ -1,9 +1,17 @@
 import threading
 import time
 import datetime
+import enum
 import logging
 import json
+import math
+import bisect
+import collections
+import concurrent.futures
+import functools
+import operator
 import random
+import re
 import config
 import os
 import statistics
@@ -26,16 +34,55 @@ except ImportError:
     # fcntl not available on Windows
     fcntl = None
 
+# orjson is optional. When installed it serializes the state file and
+# firing logs several times faster than the json module.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
+def dumps_json(obj, indent=2):
+    '''serialize obj to indented UTF-8 JSON bytes. orjson only indents
+    by 2, other indents always use the json module.'''
+    if orjson is not None and indent == 2:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=indent).encode('utf-8')
+
+def dumps_message(obj):
+    '''serialize obj to compact JSON text for websocket clients'''
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj)
+
+def loads_json(data):
+    '''parse JSON from bytes or str'''
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# anything but letters, digits, space, '-' and '_'
+UNSAFE_FILENAME_CHARS = re.compile(r'[^\w -]')
+
 class DupFilter(object):
-    def __init__(self):
-        self.msgs = set()
+    '''drops records whose message was already logged. remembers the
+       maxsize most recently seen messages so memory stays bounded
+       over a long firing.
+    '''
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.msgs = collections.OrderedDict()
 
     def filter(self, record):
-        rv = record.msg not in self.msgs
-        self.msgs.add(record.msg)
-        return rv
+        msg = record.msg
+        if msg in self.msgs:
+            self.msgs.move_to_end(msg)
+            return False
+        self.msgs[msg] = None
+        if len(self.msgs) > self.maxsize:
+            self.msgs.popitem(last=False)
+        return True
 
 class Duplogger():
     def __init__(self):
@@ -48,6 +95,31 @@ class Duplogger():
 duplog = Duplogger().logref()
 
 
+@functools.lru_cache(maxsize=32)
+def get_profile_path(profile_name):
+    """Absolute path of a stored profile, by profile name."""
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
+                                        'storage', 'profiles', "%s.json" % profile_name))
+
+
+@functools.lru_cache(maxsize=32)
+def parse_profile_json(json_data):
+    """Parse profile JSON, with legacy data points sorted by time.
+    The same profile text is parsed again and again (start, resume,
+    restart), so results are cached. They are shared, don't modify them."""
+    obj = json.loads(json_data)
+    if obj.get("version", 1) == 1:
+        obj["data"] = sorted(obj["data"])
+    return obj
+
+
+def load_profile(profile_name):
+    """Load a stored profile by name. The file is read fresh every time
+    since profiles can be edited between firings."""
+    with open(get_profile_path(profile_name)) as infile:
+        return Profile(infile.read())
+
+
 def get_zone_configs():
     """Return zone configs. If none defined, synthesize one from legacy scalars."""
     if hasattr(config, 'zones') and config.zones:
@@ -285,19 +357,18 @@ class TempTracker(object):
     '''
     def __init__(self):
         self.size = config.temperature_average_samples
-        self.temps = [0 for i in range(self.size)]
-  
+        self.temps = collections.deque([0] * self.size, maxlen=self.size)
+
     def add(self,temp):
         self.temps.append(temp)
-        while(len(self.temps) > self.size):
-            del self.temps[0]
 
     def get_avg_temp(self, chop=25):
         '''
         take the median of the given values. this used to take an avg
         after getting rid of outliers. median works better.
         '''
-        return statistics.median(self.temps)
+        # snapshot first, the sensor thread keeps appending
+        return statistics.median(tuple(self.temps))
 
 class ThermocoupleTracker(object):
     '''Keeps sliding window to track successful/failed calls to get temp
@@ -327,6 +398,91 @@ class ThermocoupleTracker(object):
             return True
         return False
 
+# NIST ITS-90 type K coefficients, highest order first for Horner evaluation.
+# Same tables adafruit_max31855.temperature_NIST uses.
+# Cold junction temperature (C) -> equivalent thermocouple voltage (mV)
+_K_VREF_POS = (-0.121047212750e-25, 0.971511471520e-22, -0.320207200030e-18,
+               0.560750590590e-15, -0.560728448890e-12, 0.318409457190e-09,
+               -0.994575928740e-07, 0.185587700320e-04, 0.389212049750e-01,
+               -0.176004136860e-01)
+_K_VREF_NEG = (-0.163226974860e-22, -0.198892668780e-19, -0.104516093650e-16,
+               -0.310888728940e-14, -0.574103274280e-12, -0.675090591730e-10,
+               -0.499048287770e-08, -0.328589067840e-06, 0.236223735980e-04,
+               0.394501280250e-01, 0.0)
+# Thermoelectric voltage (mV) -> temperature (C), by voltage range
+_K_INV_NEG = (-5.1920577e-04, -1.0450598e-02, -8.6632643e-02, -3.7342377e-01,
+              -8.9773540e-01, -1.0833638e00, -1.1662878e00, 2.5173462e01, 0.0)
+_K_INV_LOW = (-1.052755e-08, 1.057734e-06, -4.413030e-05, 9.804036e-04,
+              -1.228034e-02, 8.315270e-02, -2.503131e-01, 7.860106e-02,
+              2.508355e01, 0.0)
+_K_INV_HIGH = (-3.110810e-08, 8.802193e-06, -9.650715e-04, 5.464731e-02,
+               -1.646031e00, 4.830222e01, -1.318058e02)
+
+def _horner(coefs, x):
+    result = 0.0
+    for c in coefs:
+        result = result * x + c
+    return result
+
+def max31855_linearize(rx):
+    '''Decode one 4 byte MAX31855 frame into a NIST linearized type K
+    temperature in degrees C. Faults raise Max31855_Error with the same
+    messages the adafruit library uses.
+    '''
+    if rx[3] & 0x07:
+        if rx[3] & 0x01:
+            raise Max31855_Error("thermocouple not connected")
+        if rx[3] & 0x02:
+            raise Max31855_Error("short circuit to ground")
+        raise Max31855_Error("short circuit to power")
+    if rx[1] & 0x01:
+        raise Max31855_Error("faulty reading")
+
+    # 14 bit signed thermocouple word (0.25C/bit) and
+    # 12 bit signed cold junction word (0.0625C/bit)
+    tc_word = int.from_bytes(rx[0:2], "big", signed=True) >> 2
+    cj_word = int.from_bytes(rx[2:4], "big", signed=True) >> 4
+    tr = tc_word * 0.25
+    tamb = cj_word * 0.0625
+
+    # thermocouple voltage based on MAX31855's uV/degC for type K
+    vout = 0.041276 * (tr - tamb)
+    if tamb >= 0:
+        vref = _horner(_K_VREF_POS, tamb) + \
+            0.1185976 * math.exp(-0.1183432e-03 * (tamb - 0.1269686e03) ** 2)
+    else:
+        vref = _horner(_K_VREF_NEG, tamb)
+    vtotal = vout + vref
+
+    if -5.891 <= vtotal <= 0:
+        return _horner(_K_INV_NEG, vtotal)
+    if 0 < vtotal <= 20.644:
+        return _horner(_K_INV_LOW, vtotal)
+    if 20.644 < vtotal <= 54.886:
+        return _horner(_K_INV_HIGH, vtotal)
+    raise Max31855_Error("Total thermoelectric voltage out of range:%s" % vtotal)
+
+# MAX31856 fault status register and its bits, in the order the
+# adafruit fault dict reports them
+MAX31856_FAULT_REG = 0x0F
+MAX31856_FAULTS = (
+    ("cj_range", 0x80),
+    ("tc_range", 0x40),
+    ("cj_high", 0x20),
+    ("cj_low", 0x10),
+    ("tc_high", 0x08),
+    ("tc_low", 0x04),
+    ("voltage", 0x02),
+    ("open_tc", 0x01),
+    )
+
+def max31856_fault_name(faults):
+    '''name of the first fault set in a MAX31856 fault status byte'''
+    for name, bit in MAX31856_FAULTS:
+        if faults & bit:
+            return name
+    return None
+
 class Max31855(TempSensorReal):
     '''each subclass expected to handle errors and get temperature'''
     def __init__(self, spi, cs_pin, spi_lock=None):
@@ -334,18 +490,20 @@ class Max31855(TempSensorReal):
         log.info("thermocouple MAX31855")
         import adafruit_max31855
         self.thermocouple = adafruit_max31855.MAX31855(self.spi, self.cs)
+        self._rx = bytearray(4)
 
     def raw_temp(self):
-        try:
-            if self.spi_lock:
-                with self.spi_lock:
-                    return self.thermocouple.temperature_NIST
-            else:
-                return self.thermocouple.temperature_NIST
-        except RuntimeError as rte:
-            if rte.args and rte.args[0]:
-                raise Max31855_Error(rte.args[0])
-            raise Max31855_Error('unknown')
+        # temperature_NIST does two SPI transfers (thermocouple and cold
+        # junction) and raises RuntimeError for faults. Both values are in
+        # the same 32 bit frame, so read it once and decode it here.
+        if self.spi_lock:
+            with self.spi_lock:
+                with self.thermocouple.spi_device as spi:
+                    spi.readinto(self._rx)
+        else:
+            with self.thermocouple.spi_device as spi:
+                spi.readinto(self._rx)
+        return max31855_linearize(self._rx)
 
 class ThermocoupleError(Exception):
     '''
@@ -434,25 +592,19 @@ class Max31856(TempSensorReal):
     def raw_temp(self):
         # The underlying adafruit library does not throw exceptions
         # for thermocouple errors. Instead, they are stored in
-        # dict named self.thermocouple.fault. Here we check that
-        # dict for errors and raise an exception.
-        # and raise Max31856_Error(message)
-        try:
-            if self.spi_lock:
-                with self.spi_lock:
-                    temp = self.thermocouple.temperature
-                    for k, v in self.thermocouple.fault.items():
-                        if v:
-                            raise Max31856_Error(k)
-                    return temp
-            else:
+        # dict named self.thermocouple.fault, which is rebuilt from the
+        # fault status register on every access. Read that register
+        # directly, and only decode it when a fault bit is set.
+        if self.spi_lock:
+            with self.spi_lock:
                 temp = self.thermocouple.temperature
-                for k, v in self.thermocouple.fault.items():
-                    if v:
-                        raise Max31856_Error(k)
-                return temp
-        except Max31856_Error:
-            raise
+                faults = self.thermocouple._read_register(MAX31856_FAULT_REG, 1)[0]
+        else:
+            temp = self.thermocouple.temperature
+            faults = self.thermocouple._read_register(MAX31856_FAULT_REG, 1)[0]
+        if faults:
+            raise Max31856_Error(max31856_fault_name(faults))
+        return temp
 
 class Oven(threading.Thread):
     '''parent oven class. this has all the common code
@@ -462,6 +614,39 @@ class Oven(threading.Thread):
         self.daemon = True
         self.temperature = 0
         self.time_step = config.sensor_time_wait
+        # state files and firing logs are written on this thread, in order,
+        # so disk latency never stalls the control loop
+        self._writer = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="oven-writer")
+        # set to wake the control loop early, e.g. when a run starts or stops
+        self._wake = threading.Event()
+        self.idle_poll_interval = getattr(config, 'idle_poll_interval', 10)
+        self._use_v2 = getattr(config, 'use_rate_based_control', False)
+        # control settings read every tick, config doesn't change at runtime
+        self.rate_lookahead_seconds = getattr(config, 'rate_lookahead_seconds', 60)
+        self.max_target_divergence = getattr(config, 'max_target_divergence', 50)
+        self.rate_deviation_warning = getattr(config, 'rate_deviation_warning', 50)
+        self.heat_rate_window_seconds = getattr(config, 'heat_rate_window_seconds', 300)
+        self.state_save_interval = getattr(config, 'state_save_interval', 60)
+        # get_state fields that never change
+        self._state_template = {
+            'kwh_rate': config.kwh_rate,
+            'currency_type': config.currency_type,
+            'door': 'CLOSED',
+            'simulate': config.simulate,
+        }
+        # cooling settings are in F, convert once to the current temp scale
+        self._cooling_ambient = config.cooling_ambient_temp
+        self._cooling_target = config.cooling_target_temp
+        if config.temp_scale.lower() == "c":
+            self._cooling_ambient = (self._cooling_ambient - 32) * 5 / 9
+            self._cooling_target = (self._cooling_target - 32) * 5 / 9
+        # how long an eta estimate is reused, and how far the temperature
+        # may move before it is worked out again
+        self.eta_cache_ttl = 5
+        self.eta_cache_max_temp_change = 5
+        # seconds a set of zone sensor readings is reused within a tick
+        self.zone_sample_ttl = 0.1
         if not hasattr(self, 'zones'):
             self.zones = []  # populated by subclass before super().__init__
         self.reset()
@@ -470,8 +655,9 @@ class Oven(threading.Thread):
         self.cost = 0
         self.state = "IDLE"
         self.profile = None
+        self._is_v2 = False  # resolved whenever a profile is assigned
         self.start_time = 0
-        self.wall_clock_start_time = None     # Actual wall clock time when run started (no offset)
+        self.wall_clock_start_time = None     # time.monotonic() when run started (no offset)
         self.runtime = 0
         self.totaltime = 0
         self.target = 0
@@ -492,10 +678,16 @@ class Oven(threading.Thread):
             zone.runaway_start_time = None
             zone.runaway_start_temp = None
         self.catching_up = False
-        self.divergence_samples = []  # Track temp divergence for firing log
+        self._zone_temps_time = float('-inf')
+        # Running total of temp divergence for the firing log average
+        self.divergence_sum = 0.0
+        self.divergence_count = 0
         # Cooling estimation variables
         self.cooling_mode = False
-        self.cooling_temps = []  # List of (timestamp, temperature) tuples
+        # parallel sample timestamps and temperatures, last 30 minutes worth
+        # (30 min * 60 sec / 2 sec per sample)
+        self.cooling_times = collections.deque(maxlen=900)
+        self.cooling_temps = collections.deque(maxlen=900)
         self.cooling_estimate = None  # Estimated time remaining (HH:MM string or None)
         self.last_k_calculation_time = 0  # Track when we last calculated k
         
@@ -512,17 +704,23 @@ class Oven(threading.Thread):
             self.emergency_reason = None
 
         # Pause tracking
-        self._pause_start_time = None
+        self._pause_start_time = None        # time.monotonic() when paused
 
         # Segment-based control state (v2 profile format)
         self.current_segment_index = 0
         self.segment_phase = 'ramp'           # 'ramp' or 'hold'
-        self.segment_start_time = None
+        self.segment_start_time = None        # time.monotonic() when segment began
         self.segment_start_temp = None
-        self.hold_start_time = None
+        self.hold_start_time = None           # time.monotonic() when hold began
+        self._tick_now = time.monotonic()
+        self._next_tick = None                # monotonic deadline of the next tick
+        self._tick_duty = 0                   # seconds this tick spent driving the relays
+        # (time, segment index, phase, temperature, eta) of the last estimate
+        self._eta_cache = None
         self.actual_elapsed_time = 0          # Wall clock time since run started (no offset)
         self.schedule_progress = 0.0          # 0-100% based on temp progress
         self.target_heat_rate = 0             # The rate we're trying to achieve
+        self.target_rate_mode = RateMode.NUMERIC  # how target_heat_rate is read
 
     @staticmethod
     def get_start_from_temperature(profile, temp):
@@ -542,7 +740,7 @@ class Oven(threading.Thread):
         # Minimum samples to keep (ensures we have enough data points)
         min_samples = 10
         # Time window in seconds (default 5 minutes of simulated time)
-        rate_window_seconds = getattr(config, 'heat_rate_window_seconds', 300)
+        rate_window_seconds = self.heat_rate_window_seconds
         
         self.heat_rate_temps.append((runtime, temp))
         
@@ -569,6 +767,18 @@ class Oven(threading.Thread):
             if time2 > time1:
                 self.heat_rate = ((temp2 - temp1) / (time2 - time1))*3600
 
+    def _sample_zone_temps(self):
+        '''read every zone's sensor into zone.temperature. readings are
+           reused for zone_sample_ttl seconds so the methods called during
+           one control loop tick share one set of sensor reads. run()
+           invalidates them at the top of each tick.'''
+        now = time.monotonic()
+        if now - self._zone_temps_time < self.zone_sample_ttl:
+            return
+        for zone in self.zones:
+            zone.temperature = zone.temp_sensor.temperature() + zone.thermocouple_offset
+        self._zone_temps_time = now
+
     def get_control_temperature(self):
         """Return the temperature that drives profile progression, per strategy."""
         if not self.zones:
@@ -608,8 +818,7 @@ class Oven(threading.Thread):
         if allow_seek:
             if self.state == 'IDLE':
                 if config.seek_start:
-                    for zone in self.zones:
-                        zone.temperature = zone.temp_sensor.temperature() + zone.thermocouple_offset
+                    self._sample_zone_temps()
                     temp = self.get_control_temperature()
                     runtime += self.get_start_from_temperature(profile, temp)
 
@@ -619,16 +828,16 @@ class Oven(threading.Thread):
         self.startat = runtime  # Includes both manual startat and seek_offset
         self.runtime = runtime
         self.start_time = datetime.datetime.now() - datetime.timedelta(seconds=self.startat)
-        self.wall_clock_start_time = datetime.datetime.now()  # Actual wall clock start (no offset)
+        self.wall_clock_start_time = time.monotonic()  # Actual wall clock start (no offset)
         self.profile = profile
+        self._is_v2 = self._use_v2 and hasattr(profile, 'segments')
         self.totaltime = profile.get_duration()
         self.state = "RUNNING"
         
         # Initialize segment-based control state (v2 profile format)
-        if getattr(config, 'use_rate_based_control', False) and hasattr(profile, 'segments'):
+        if self._is_v2:
             try:
-                for zone in self.zones:
-                    zone.temperature = zone.temp_sensor.temperature() + zone.thermocouple_offset
+                self._sample_zone_temps()
                 current_temp = self.get_control_temperature()
             except (AttributeError, TypeError):
                 current_temp = profile.start_temp
@@ -645,14 +854,15 @@ class Oven(threading.Thread):
                 self.current_segment_index = 0
                 self.segment_phase = 'ramp'
 
-            self.segment_start_time = datetime.datetime.now()
+            self.segment_start_time = time.monotonic()
             self.segment_start_temp = current_temp
-            self.hold_start_time = datetime.datetime.now() if self.segment_phase == 'hold' else None
+            self.hold_start_time = time.monotonic() if self.segment_phase == 'hold' else None
             log.info("Using rate-based control with %d segments (starting at segment %d, %s)" %
                      (len(profile.segments), self.current_segment_index, self.segment_phase))
         
         log.info("Running schedule %s starting at %d minutes" % (profile.name,startat))
         log.info("Starting")
+        self._wake.set()
 
     def abort_run(self):
         # Save resume state BEFORE reset (needs current segment info)
@@ -663,6 +873,7 @@ class Oven(threading.Thread):
         self.reset()
         # Clear automatic restart state so server restart won't auto-resume an intentional abort
         self.clear_automatic_restart_state()
+        self._wake.set()
 
     def get_start_time(self):
         return datetime.datetime.now() - datetime.timedelta(milliseconds = self.runtime * 1000)
@@ -671,8 +882,7 @@ class Oven(threading.Thread):
         '''shift the whole schedule forward in time by one time_step
         to wait for the kiln to catch up'''
         if config.kiln_must_catch_up == True:
-            for zone in self.zones:
-                zone.temperature = zone.temp_sensor.temperature() + zone.thermocouple_offset
+            self._sample_zone_temps()
             temp = self.get_control_temperature()
             # kiln too cold, wait for it to heat up
             if self.target - temp > config.pid_control_window:
@@ -698,9 +908,10 @@ class Oven(threading.Thread):
 
     def update_target_temp(self):
         """Update target temperature - uses segment-based or legacy mode"""
-        if getattr(config, 'use_rate_based_control', False) and hasattr(self.profile, 'segments'):
+        if self._is_v2:
             self.target = self.calculate_rate_based_target()
             self.target_heat_rate = self.profile.get_rate_for_segment(self.current_segment_index)
+            self.target_rate_mode = self.profile.get_rate_mode_for_segment(self.current_segment_index)
         else:
             self.target = self.profile.get_target_temperature(self.runtime)
     
@@ -713,35 +924,22 @@ class Oven(threading.Thread):
         Update which segment we're in based on actual temperature.
         Progress is temperature-based, not time-based.
         """
-        if not hasattr(self.profile, 'segments') or not self.profile.segments:
+        if not self.profile.segments:
             return
 
-        for zone in self.zones:
-            zone.temperature = zone.temp_sensor.temperature() + zone.thermocouple_offset
+        self._sample_zone_temps()
         temp = self.get_control_temperature()
         segment = self.profile.segments[self.current_segment_index]
-        tolerance = getattr(config, 'segment_complete_tolerance', 5)
         
         if self.segment_phase == 'ramp':
             # Check if we've reached target temperature
-            reached_target = False
-            if isinstance(segment.rate, (int, float)):
-                if segment.rate > 0:  # Heating
-                    reached_target = temp >= segment.target - tolerance
-                elif segment.rate < 0:  # Cooling
-                    reached_target = temp <= segment.target + tolerance
-                elif segment.rate == 0:  # Pure hold
-                    reached_target = True
-            elif segment.rate == "max":
-                reached_target = temp >= segment.target - tolerance
-            elif segment.rate == "cool":
-                reached_target = temp <= segment.target + tolerance
+            reached_target = self.profile.ramp_complete(self.current_segment_index, temp)
             
             if reached_target:
                 if segment.hold > 0:
                     # Transition to hold phase
                     self.segment_phase = 'hold'
-                    self.hold_start_time = datetime.datetime.now()
+                    self.hold_start_time = self._tick_now
                     log.info("Segment %d: reached target %.1f, starting %.1f min hold" % 
                              (self.current_segment_index, segment.target, segment.hold/60))
                 else:
@@ -751,7 +949,7 @@ class Oven(threading.Thread):
         elif self.segment_phase == 'hold':
             # Check if hold time has elapsed
             if self.hold_start_time:
-                hold_elapsed = (datetime.datetime.now() - self.hold_start_time).total_seconds()
+                hold_elapsed = self._tick_now - self.hold_start_time
                 if hold_elapsed >= segment.hold:
                     self._advance_segment()
     
@@ -779,7 +977,7 @@ class Oven(threading.Thread):
                 log.error("Failed to save firing log: %s" % e)
         else:
             self.segment_phase = 'ramp'
-            self.segment_start_time = datetime.datetime.now()
+            self.segment_start_time = self._tick_now
             self.segment_start_temp = self.get_control_temperature()
             next_seg = self.profile.segments[self.current_segment_index]
             log.info("Starting segment %d: rate=%s, target=%.1f" %
@@ -800,7 +998,7 @@ class Oven(threading.Thread):
         2. Lead for PID: rate * lookahead_seconds / 3600 (capped)
         3. Target = ceiling + lead, clamped to segment target
         """
-        if not hasattr(self.profile, 'segments') or not self.profile.segments:
+        if not self.profile.segments:
             return self.profile.get_target_temperature(self.runtime)
         
         if self.current_segment_index >= len(self.profile.segments):
@@ -813,7 +1011,7 @@ class Oven(threading.Thread):
         
         segment = self.profile.segments[self.current_segment_index]
         
-        if segment.rate in ("max", "cool"):
+        if segment.rate_mode != RateMode.NUMERIC:
             # For max/cool, target is the segment target
             return segment.target
         
@@ -823,13 +1021,14 @@ class Oven(threading.Thread):
         
         # Get current actual temperature (direct sensor read for PID accuracy)
         try:
-            actual_temp = self.zones[0].temp_sensor.temperature() + self.zones[0].thermocouple_offset
+            self._sample_zone_temps()
+            actual_temp = self.zones[0].temperature
         except (AttributeError, TypeError):
             actual_temp = self.segment_start_temp if self.segment_start_temp else 0
 
         # Calculate elapsed time since segment start
         if self.segment_start_time:
-            elapsed_seconds = (datetime.datetime.now() - self.segment_start_time).total_seconds()
+            elapsed_seconds = self._tick_now - self.segment_start_time
         else:
             elapsed_seconds = 0
         elapsed_hours = elapsed_seconds / 3600
@@ -840,13 +1039,13 @@ class Oven(threading.Thread):
         rate_based_ceiling = start_temp + (segment.rate * elapsed_hours)
         
         # Calculate lead for PID responsiveness
-        lookahead_seconds = getattr(config, 'rate_lookahead_seconds', 60)  # Default 60 seconds
+        lookahead_seconds = self.rate_lookahead_seconds
         effective_lookahead = min(elapsed_seconds, lookahead_seconds)
         effective_lookahead_hours = effective_lookahead / 3600
         raw_lead = segment.rate * effective_lookahead_hours  # degrees of lead
         
         # Cap the lead to prevent runaway with extreme rates
-        max_divergence = getattr(config, 'max_target_divergence', 50)  # Default 50 degrees
+        max_divergence = self.max_target_divergence
         if abs(raw_lead) > max_divergence:
             lead = max_divergence if raw_lead > 0 else -max_divergence
         else:
@@ -867,26 +1066,26 @@ class Oven(threading.Thread):
         Monitor actual heat rate vs target rate and log warnings if deviation is excessive.
         Replaces the old kiln_must_catch_up() behavior with logging-based feedback.
         """
-        if not getattr(config, 'use_rate_based_control', False):
+        if not self._is_v2:
             return
         
         if self.segment_phase != 'ramp':
             return  # Only check during ramp phase
         
-        if not hasattr(self.profile, 'segments') or self.current_segment_index >= len(self.profile.segments):
+        if self.current_segment_index >= len(self.profile.segments):
             return
         
         segment = self.profile.segments[self.current_segment_index]
         
         # Skip check for special rates
-        if not isinstance(segment.rate, (int, float)) or segment.rate == 0:
+        if segment.rate_mode != RateMode.NUMERIC or segment.rate == 0:
             return
         
         target_rate = abs(segment.rate)
         actual_rate = abs(self.heat_rate) if self.heat_rate else 0
         deviation = abs(target_rate - actual_rate)
         
-        warning_threshold = getattr(config, 'rate_deviation_warning', 50)
+        warning_threshold = self.rate_deviation_warning
         if deviation > warning_threshold:
             if actual_rate < target_rate:
                 log.warning(
@@ -916,59 +1115,54 @@ class Oven(threading.Thread):
     
     def estimate_remaining_time(self):
         """Estimate remaining time based on rates"""
-        if not self.profile or not hasattr(self.profile, 'segments'):
+        if not self._is_v2:
             return 0
         
         remaining = 0
         current_temp = self.get_control_temperature()
 
+        # The estimate moves slowly, reuse the last one for a few seconds
+        # unless the segment, phase or temperature has moved on
+        segments = self.profile.segments
+        index = self.current_segment_index
+        now = time.monotonic()
+        if self._eta_cache is not None:
+            cached_time, cached_index, cached_phase, cached_temp, cached_eta = self._eta_cache
+            if (now - cached_time < self.eta_cache_ttl
+                    and cached_index == index
+                    and cached_phase == self.segment_phase
+                    and abs(current_temp - cached_temp) <= self.eta_cache_max_temp_change):
+                return cached_eta
+
+        if index >= len(segments):
+            return remaining
+        seconds_per_degree = self.profile.seconds_per_degree
+        hold_seconds = self.profile.hold_seconds
+
         # Time remaining in current segment
-        if self.current_segment_index < len(self.profile.segments):
-            segment = self.profile.segments[self.current_segment_index]
-            
-            if self.segment_phase == 'ramp':
-                temp_remaining = abs(segment.target - current_temp)
-                if isinstance(segment.rate, (int, float)) and segment.rate != 0:
-                    remaining += (temp_remaining / abs(segment.rate)) * 3600
-                elif segment.rate == "max":
-                    max_rate = getattr(config, 'estimated_max_heating_rate', 500)
-                    remaining += (temp_remaining / max_rate) * 3600
-                elif segment.rate == "cool":
-                    cool_rate = getattr(config, 'estimated_natural_cooling_rate', 100)
-                    remaining += (temp_remaining / cool_rate) * 3600
-                remaining += segment.hold
-            elif self.segment_phase == 'hold':
-                if self.hold_start_time:
-                    hold_elapsed = (datetime.datetime.now() - self.hold_start_time).total_seconds()
-                    remaining += max(0, segment.hold - hold_elapsed)
+        segment = segments[index]
+        if self.segment_phase == 'ramp':
+            remaining += self.profile.ramp_seconds(index, current_temp)
+            remaining += hold_seconds[index]
+        elif self.segment_phase == 'hold':
+            if self.hold_start_time:
+                hold_elapsed = now - self.hold_start_time
+                remaining += max(0, segment.hold - hold_elapsed)
         
         # Add remaining segments - start from current segment's target
         # (we already accounted for time to reach it above)
-        if self.current_segment_index >= len(self.profile.segments):
-            return remaining
-        prev_target = self.profile.segments[self.current_segment_index].target
-        for i in range(self.current_segment_index + 1, len(self.profile.segments)):
-            segment = self.profile.segments[i]
-            temp_diff = abs(segment.target - prev_target)
-            if isinstance(segment.rate, (int, float)) and segment.rate != 0:
-                remaining += (temp_diff / abs(segment.rate)) * 3600
-            elif segment.rate == "max":
-                max_rate = getattr(config, 'estimated_max_heating_rate', 500)
-                remaining += (temp_diff / max_rate) * 3600
-            elif segment.rate == "cool":
-                cool_rate = getattr(config, 'estimated_natural_cooling_rate', 100)
-                remaining += (temp_diff / cool_rate) * 3600
-            remaining += segment.hold
-            prev_target = segment.target
-        
+        prev_target = segment.target
+        for i in range(index + 1, len(segments)):
+            target = segments[i].target
+            remaining += abs(target - prev_target) * seconds_per_degree[i] + hold_seconds[i]
+            prev_target = target
+
+        self._eta_cache = (now, index, self.segment_phase, current_temp, remaining)
         return remaining
     
     def reset_if_schedule_ended_v2(self):
         """Check if all segments are complete (v2 profile format)"""
-        if not getattr(config, 'use_rate_based_control', False):
-            return
-        
-        if not hasattr(self.profile, 'segments'):
+        if not self._is_v2:
             return
         
         # Check if we've completed all segments
@@ -1017,10 +1211,10 @@ class Oven(threading.Thread):
         
         # CRITICAL: These must always execute
         self.reset()
-        # Bypass the throttled save_automatic_restart_state() and write
-        # directly so the emergency IDLE state is guaranteed to reach disk.
+        # Bypass the throttled save_automatic_restart_state() and wait for
+        # the write so the emergency IDLE state is guaranteed to reach disk.
         if config.automatic_restarts:
-            self.save_state()
+            self.save_state().result()
 
     def reset_if_emergency(self):
         '''reset if the temperature is way TOO HOT, or other critical errors detected'''
@@ -1169,26 +1363,27 @@ class Oven(threading.Thread):
         With multi-zone, tracks the max deviation across all zones."""
         try:
             if self.zones:
-                max_dev = max(abs(z.target - z.temperature) for z in self.zones)
-                self.divergence_samples.append(max_dev)
+                divergence = max(abs(z.target - z.temperature) for z in self.zones)
             else:
                 temp = self.get_control_temperature()
                 divergence = abs(self.target - temp)
-                self.divergence_samples.append(divergence)
+            self.divergence_sum += divergence
+            self.divergence_count += 1
         except (AttributeError, TypeError):
             # Handle cases where temp sensor isn't ready
             pass
     
     def calculate_avg_divergence(self):
         """Calculate average temperature divergence over the entire firing"""
-        if not self.divergence_samples:
+        if not self.divergence_count:
             return 0.0
-        return sum(self.divergence_samples) / len(self.divergence_samples)
+        return self.divergence_sum / self.divergence_count
 
     def start_cooling(self):
         """Initialize cooling mode after firing schedule completes"""
         self.cooling_mode = True
-        self.cooling_temps = []
+        self.cooling_times.clear()
+        self.cooling_temps.clear()
         self.cooling_estimate = None
         self.last_k_calculation_time = time.time()
         log.info("Cooling mode activated - tracking temperature for estimate")
@@ -1201,58 +1396,50 @@ class Oven(threading.Thread):
         Using curve fitting on recent temperature samples to determine k.
         Returns k value or None if insufficient data.
         """
-        import math
-        
         if len(self.cooling_temps) < config.cooling_min_samples:
             return None
         
-        # Get ambient temperature in current temp scale
-        ambient_temp = config.cooling_ambient_temp
-        if config.temp_scale.lower() == "c":
-            # Convert from F to C
-            ambient_temp = (ambient_temp - 32) * 5 / 9
-        
+        ambient_temp = self._cooling_ambient
+
         # Use linear regression on ln((T - T_ambient) / (T0 - T_ambient)) = -k*t
         # to find k
         try:
-            t0 = self.cooling_temps[0][0]
-            T0 = self.cooling_temps[0][1]
+            t0 = self.cooling_times[0]
+            T0 = self.cooling_temps[0]
             
             # Check if already close to ambient (not enough delta to measure)
             if abs(T0 - ambient_temp) < 10:
                 log.debug("Temperature too close to ambient for accurate k calculation")
                 return None
             
-            # Prepare data for linear regression
-            x_values = []  # time differences
-            y_values = []  # ln((T - T_ambient) / (T0 - T_ambient))
-            
-            for timestamp, temp in self.cooling_temps:
-                delta_t = timestamp - t0
+            # Kiln below ambient, nothing to fit
+            initial_diff = T0 - ambient_temp
+            if initial_diff <= 0:
+                return None
+
+            # Accumulate the linear regression sums in one pass, skipping
+            # samples at or below ambient
+            # x: time differences
+            # y: ln((T - T_ambient) / (T0 - T_ambient))
+            ln = math.log
+            n = 0
+            sum_x = sum_y = sum_xx = sum_xy = 0.0
+            for timestamp, temp in zip(self.cooling_times, self.cooling_temps):
                 temp_diff = temp - ambient_temp
-                initial_diff = T0 - ambient_temp
-                
-                # Skip if temperature difference is too small or negative
-                if temp_diff <= 0 or initial_diff <= 0:
-                    continue
-                
-                ratio = temp_diff / initial_diff
-                if ratio <= 0:
+                if temp_diff <= 0:
                     continue
-                
-                x_values.append(delta_t)
-                y_values.append(math.log(ratio))
-            
-            if len(x_values) < config.cooling_min_samples:
+                x = timestamp - t0
+                y = ln(temp_diff / initial_diff)
+                n += 1
+                sum_x += x
+                sum_y += y
+                sum_xx += x * x
+                sum_xy += x * y
+
+            if n < config.cooling_min_samples:
                 return None
-            
+
             # Linear regression: y = mx + b, where m = -k
-            n = len(x_values)
-            sum_x = sum(x_values)
-            sum_y = sum(y_values)
-            sum_xx = sum(x * x for x in x_values)
-            sum_xy = sum(x * y for x, y in zip(x_values, y_values))
-            
             denominator = (n * sum_xx - sum_x * sum_x)
             if abs(denominator) < 1e-10:
                 return None
@@ -1279,17 +1466,9 @@ class Oven(threading.Thread):
         
         Solving for t: t = -ln((T_target - T_ambient) / (T_current - T_ambient)) / k
         """
-        import math
-        
-        # Get temperatures in current temp scale
-        target_temp = config.cooling_target_temp
-        ambient_temp = config.cooling_ambient_temp
-        
-        if config.temp_scale.lower() == "c":
-            # Convert from F to C
-            target_temp = (target_temp - 32) * 5 / 9
-            ambient_temp = (ambient_temp - 32) * 5 / 9
-        
+        target_temp = self._cooling_target
+        ambient_temp = self._cooling_ambient
+
         # Check if already at or below target
         if current_temp <= target_temp:
             return 0
@@ -1335,20 +1514,13 @@ class Oven(threading.Thread):
             current_temp = self.get_control_temperature()
             current_time = time.time()
 
-            # Add current temperature to tracking list
-            self.cooling_temps.append((current_time, current_temp))
-            
-            # Keep only recent samples (last 30 minutes worth)
-            max_samples = 900  # 30 min * 60 sec / 2 sec per sample
-            if len(self.cooling_temps) > max_samples:
-                self.cooling_temps = self.cooling_temps[-max_samples:]
-            
+            # Add current temperature to tracking lists, the deques drop
+            # samples older than the last 30 minutes
+            self.cooling_times.append(current_time)
+            self.cooling_temps.append(current_temp)
+
             # Check if temperature is already below target
-            target_temp = config.cooling_target_temp
-            if config.temp_scale.lower() == "c":
-                target_temp = (target_temp - 32) * 5 / 9
-            
-            if current_temp <= target_temp:
+            if current_temp <= self._cooling_target:
                 self.cooling_estimate = "Ready"
                 return
             
@@ -1376,11 +1548,10 @@ class Oven(threading.Thread):
 
     def get_state(self):
         # Read all zone temperatures
-        for zone in self.zones:
-            try:
-                zone.temperature = zone.temp_sensor.temperature() + zone.thermocouple_offset
-            except (AttributeError, TypeError):
-                pass  # startup race
+        try:
+            self._sample_zone_temps()
+        except (AttributeError, TypeError):
+            pass  # startup race
 
         # Control temperature drives the schedule
         if self.zones:
@@ -1388,7 +1559,7 @@ class Oven(threading.Thread):
         else:
             temp = 0
 
-        time_for_heat_rate = self.actual_elapsed_time if getattr(config, 'use_rate_based_control', False) else self.runtime
+        time_for_heat_rate = self.actual_elapsed_time if self._use_v2 else self.runtime
 
         # Per-zone heat rates
         for zone in self.zones:
@@ -1403,26 +1574,21 @@ class Oven(threading.Thread):
         # Top-level pidstats: use first zone's by default, override with control zone below
         top_pidstats = self.zones[0].pid.pidstats if self.zones else self.pid.pidstats
 
-        state = {
-            'cost': self.cost,
-            'runtime': self.runtime,
-            'actual_elapsed_time': self.actual_elapsed_time,
-            'temperature': temp,
-            'target': self.target,
-            'state': self.state,
-            'heat': avg_heat,
-            'heat_rate': self.heat_rate,
-            'totaltime': self.totaltime,
-            'kwh_rate': config.kwh_rate,
-            'currency_type': config.currency_type,
-            'profile': self.profile.name if self.profile else None,
-            'pidstats': top_pidstats,
-            'catching_up': self.catching_up,
-            'door': 'CLOSED',
-            'cooling_estimate': self.cooling_estimate if self.cooling_mode else None,
-            'simulate': config.simulate,
-            'emergency': self.emergency_reason,
-        }
+        state = self._state_template.copy()
+        state['cost'] = self.cost
+        state['runtime'] = self.runtime
+        state['actual_elapsed_time'] = self.actual_elapsed_time
+        state['temperature'] = temp
+        state['target'] = self.target
+        state['state'] = self.state
+        state['heat'] = avg_heat
+        state['heat_rate'] = self.heat_rate
+        state['totaltime'] = self.totaltime
+        state['profile'] = self.profile.name if self.profile else None
+        state['pidstats'] = top_pidstats
+        state['catching_up'] = self.catching_up
+        state['cooling_estimate'] = self.cooling_estimate if self.cooling_mode else None
+        state['emergency'] = self.emergency_reason
 
         # Add zone data when multi-zone
         if len(self.zones) > 1:
@@ -1453,19 +1619,31 @@ class Oven(threading.Thread):
                     break
 
         # v2 segment fields (keep existing logic)
-        if getattr(config, 'use_rate_based_control', False) and self.profile and hasattr(self.profile, 'segments'):
+        if self._is_v2:
             state['target_heat_rate'] = self.target_heat_rate
             state['progress'] = self.schedule_progress
             state['current_segment'] = self.current_segment_index
             state['segment_phase'] = self.segment_phase
-            state['eta_seconds'] = self.estimate_remaining_time()
+            # the eta walks the remaining segments, only work it out
+            # when a browser or mqtt is there to show it
+            watcher = getattr(self, 'ovenwatcher', None)
+            if watcher is None or watcher.has_listeners():
+                state['eta_seconds'] = self.estimate_remaining_time()
             state['total_segments'] = len(self.profile.segments)
 
         return state
 
     def save_state(self):
-        """Save state to file with atomic write"""
+        """Queue an atomic write of the current state to the state file.
+        The state is captured on the calling thread and written on the
+        writer thread. Returns the write's future."""
+        return self._writer.submit(self._write_state, self.get_state())
+
+    def _write_state(self, state):
+        """Write state to file with atomic write"""
         try:
+            blob = dumps_json(state, indent=4)
+
             # Write to temporary file in same directory (ensures same filesystem)
             temp_fd, temp_path = tempfile.mkstemp(
                 dir=os.path.dirname(config.automatic_restart_state_file),
@@ -1473,7 +1651,7 @@ class Oven(threading.Thread):
                 suffix='.json'
             )
             
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+            with os.fdopen(temp_fd, 'wb') as f:
                 # Optional: Lock the file for exclusive access
                 if fcntl is not None:
                     try:
@@ -1482,9 +1660,10 @@ class Oven(threading.Thread):
                         pass
                 
                 try:
-                    json.dump(self.get_state(), f, ensure_ascii=False, indent=4)
-                    f.flush()
-                    os.fsync(f.fileno())  # Force write to disk
+                    f.write(blob)
+                    if getattr(config, 'fsync_state_file', False):
+                        f.flush()
+                        os.fsync(f.fileno())  # Force write to disk
                 finally:
                     if fcntl is not None:
                         try:
@@ -1527,7 +1706,7 @@ class Oven(threading.Thread):
         now = time.time()
         # Always save if enough time has passed
         # Note: Critical state changes (like abort/complete) should call save_state() directly
-        if (now - self.last_state_save) < getattr(config, 'state_save_interval', 60):
+        if (now - self.last_state_save) < self.state_save_interval:
             return False
 
         self.save_state()
@@ -1546,13 +1725,15 @@ class Oven(threading.Thread):
             if hasattr(self, 'ovenwatcher') and self.ovenwatcher.last_log:
                 # Subsample to reasonable size (max 500 points)
                 temp_log = self.ovenwatcher.lastlog_subset(maxpts=500)
-                # Extract needed fields, preferring actual_elapsed_time for the time axis
+                # Extract needed fields, preferring actual_elapsed_time for the time axis.
+                # Every entry is a get_state() snapshot, so the keys are always present.
+                fields = operator.itemgetter('runtime', 'actual_elapsed_time', 'temperature', 'target')
                 temp_log = [{
-                    'runtime': round(entry.get('runtime', 0), 2),
-                    'actual_elapsed_time': round(entry.get('actual_elapsed_time', entry.get('runtime', 0)), 2),
-                    'temperature': round(entry.get('temperature', 0), 2),
-                    'target': round(entry.get('target', 0), 2)
-                } for entry in temp_log]
+                    'runtime': round(runtime, 2),
+                    'actual_elapsed_time': round(elapsed, 2),
+                    'temperature': round(temperature, 2),
+                    'target': round(target, 2)
+                } for runtime, elapsed, temperature, target in map(fields, temp_log)]
             
             # Get the adjusted profile curve (starts at actual kiln temp)
             adjusted_profile = None
@@ -1588,18 +1769,10 @@ class Oven(threading.Thread):
                 'adjusted_profile': adjusted_profile
             }
             
-            # Save to firing logs directory
-            os.makedirs(config.firing_logs_directory, exist_ok=True)
             timestamp = datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-            safe_profile_name = "".join(c for c in self.profile.name if c.isalnum() or c in (' ', '-', '_')).strip()
+            safe_profile_name = UNSAFE_FILENAME_CHARS.sub('', self.profile.name).strip()
             filename = f"{timestamp}_{safe_profile_name}.json"
-            filepath = os.path.join(config.firing_logs_directory, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(firing_log, f, ensure_ascii=False, indent=2)
-            
-            log.info(f"Firing log saved: {filepath}")
-            
+
             # Also save as "last firing" summary
             last_firing_summary = {
                 'profile_name': self.profile.name,
@@ -1612,9 +1785,32 @@ class Oven(threading.Thread):
                 'status': status,
                 'log_filename': filename
             }
+
+            # Serializing and writing to the SD card can take long enough
+            # to upset the control loop, so hand it to the writer thread
+            self._writer.submit(self._write_firing_log, firing_log,
+                                last_firing_summary, filename)
+            return True
             
-            with open(config.last_firing_file, 'w', encoding='utf-8') as f:
-                json.dump(last_firing_summary, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            log.error(f"Failed to save firing log: {e}")
+            return False
+
+    def _write_firing_log(self, firing_log, last_firing_summary, filename):
+        """Write a firing log built by save_firing_log, and the last firing
+        summary, to disk. Runs on the writer thread."""
+        try:
+            # Save to firing logs directory
+            os.makedirs(config.firing_logs_directory, exist_ok=True)
+            filepath = os.path.join(config.firing_logs_directory, filename)
+            
+            with open(filepath, 'wb') as f:
+                f.write(dumps_json(firing_log))
+            
+            log.info(f"Firing log saved: {filepath}")
+            
+            with open(config.last_firing_file, 'wb') as f:
+                f.write(dumps_json(last_firing_summary))
             
             log.info(f"Last firing summary saved: {config.last_firing_file}")
             return True
@@ -1655,7 +1851,7 @@ class Oven(threading.Thread):
             resume_data['zone_temperatures'] = [z.temperature for z in self.zones]
 
             # Save segment state for v2 profiles
-            if getattr(config, 'use_rate_based_control', False) and hasattr(self.profile, 'segments'):
+            if self._is_v2:
                 resume_data['current_segment'] = self.current_segment_index
                 resume_data['segment_phase'] = self.segment_phase
                 resume_data['total_segments'] = len(self.profile.segments)
@@ -1671,8 +1867,8 @@ class Oven(threading.Thread):
                 prefix='.tmp_resume_',
                 suffix='.json'
             )
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                json.dump(resume_data, f, ensure_ascii=False, indent=2)
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(dumps_json(resume_data))
                 f.flush()
                 os.fsync(f.fileno())
 
@@ -1693,7 +1889,12 @@ class Oven(threading.Thread):
             return False
 
     def clear_automatic_restart_state(self):
-        """Remove state.json so a server restart won't auto-resume an intentional abort."""
+        """Remove state.json so a server restart won't auto-resume an intentional abort.
+        Queued on the writer thread behind any pending state write, so an
+        earlier save can't recreate the file after it is removed."""
+        return self._writer.submit(self._remove_automatic_restart_state)
+
+    def _remove_automatic_restart_state(self):
         try:
             if os.path.isfile(config.automatic_restart_state_file):
                 os.remove(config.automatic_restart_state_file)
@@ -1727,8 +1928,8 @@ class Oven(threading.Thread):
                           (minutes_old, config.automatic_restart_window))
                 return None
 
-            with open(resume_file, 'r') as f:
-                data = json.load(f)
+            with open(resume_file, 'rb') as f:
+                data = loads_json(f.read())
 
             if data.get('state') != 'aborted':
                 return None
@@ -1854,21 +2055,14 @@ class Oven(threading.Thread):
         if not profile_name:
             return {"success": False, "error": "Resume state missing profile name"}
 
-        filename = "%s.json" % profile_name
-        profile_path = os.path.abspath(os.path.join(
-            os.path.dirname(__file__), '..', 'storage', 'profiles', filename))
-
         try:
-            with open(profile_path) as infile:
-                profile_json = json.dumps(json.load(infile))
-            profile = Profile(profile_json)
+            profile = load_profile(profile_name)
         except (IOError, json.JSONDecodeError) as e:
             return {"success": False, "error": "Failed to load profile '%s': %s" % (profile_name, e)}
 
         # Get current temperature, restoring per-zone temps from resume state as fallback
         try:
-            for zone in self.zones:
-                zone.temperature = zone.temp_sensor.temperature() + zone.thermocouple_offset
+            self._sample_zone_temps()
             current_temp = self.get_control_temperature()
         except (AttributeError, TypeError):
             zone_temps = resume_data.get('zone_temperatures', None)
@@ -1883,7 +2077,7 @@ class Oven(threading.Thread):
             current_temp = resume_data.get('temperature', 0)
 
         # V2 segment-based resume with temperature-aware seeking
-        if getattr(config, 'use_rate_based_control', False) and 'current_segment' in resume_data and hasattr(profile, 'segments'):
+        if self._use_v2 and 'current_segment' in resume_data and hasattr(profile, 'segments'):
             saved_segment = resume_data.get('current_segment', 0)
 
             # Find the correct segment based on current temperature and direction of travel
@@ -1899,22 +2093,24 @@ class Oven(threading.Thread):
 
             self.reset()
             self.profile = profile
+            self._is_v2 = self._use_v2 and hasattr(profile, 'segments')
             self.totaltime = profile.get_duration()
             self.start_time = datetime.datetime.now()
-            self.wall_clock_start_time = datetime.datetime.now()
+            self.wall_clock_start_time = time.monotonic()
 
             # Set segment state
             self.current_segment_index = resume_segment
             self.segment_phase = resume_phase
-            self.segment_start_time = datetime.datetime.now()
+            self.segment_start_time = time.monotonic()
             self.segment_start_temp = current_temp
 
             if resume_phase == 'hold':
-                self.hold_start_time = datetime.datetime.now()
+                self.hold_start_time = time.monotonic()
                 log.info("Resuming hold phase - hold timer restarted from now")
 
             self.cost = resume_data.get('cost', 0)
             self.state = "RUNNING"
+            self._wake.set()
 
             log.info("Resume: starting segment %d (%s phase) at %.1f deg" %
                      (resume_segment, resume_phase, current_temp))
@@ -1941,12 +2137,14 @@ class Oven(threading.Thread):
         # only automatic restart if the feature is enabled
         if not config.automatic_restarts == True:
             return False
+        # let queued state writes and removals land before reading the file
+        self._writer.submit(lambda: None).result()
         if self.state_file_is_old():
             duplog.info("automatic restart not possible. state file does not exist or is too old.")
             return False
 
         try:
-            with open(config.automatic_restart_state_file, 'r') as infile:
+            with open(config.automatic_restart_state_file, 'rb') as infile:
                 # Optional: Shared read lock
                 if fcntl is not None:
                     try:
@@ -1955,7 +2153,7 @@ class Oven(threading.Thread):
                         pass
                 
                 try:
-                    d = json.load(infile)
+                    d = loads_json(infile.read())
                 finally:
                     if fcntl is not None:
                         try:
@@ -1978,46 +2176,42 @@ class Oven(threading.Thread):
 
     def automatic_restart(self):
         try:
-            with open(config.automatic_restart_state_file) as infile:
-                d = json.load(infile)
+            with open(config.automatic_restart_state_file, 'rb') as infile:
+                d = loads_json(infile.read())
         except (IOError, ValueError, json.JSONDecodeError) as e:
             log.error("Failed to read state file for automatic restart: %s" % e)
             self.clear_automatic_restart_state()
             return
 
         try:
-            filename = "%s.json" % (d["profile"])
-            profile_path = os.path.abspath(os.path.join(os.path.dirname( __file__ ), '..', 'storage','profiles',filename))
-
-            with open(profile_path) as infile:
-                profile_json = json.dumps(json.load(infile))
-            profile = Profile(profile_json)
+            profile_path = get_profile_path(d["profile"])
+            profile = load_profile(d["profile"])
         except (IOError, ValueError, KeyError, json.JSONDecodeError) as e:
             log.error("Failed to load profile for automatic restart: %s" % e)
             self.clear_automatic_restart_state()
             return
 
         # Check if this is v2 segment-based state
-        if getattr(config, 'use_rate_based_control', False) and 'current_segment' in d and hasattr(profile, 'segments'):
+        if self._use_v2 and 'current_segment' in d and hasattr(profile, 'segments'):
             # V2 segment-based restart
             log.info("Automatic restart (v2): profile=%s, segment=%d, phase=%s" %
                      (d["profile"], d.get("current_segment", 0), d.get("segment_phase", "ramp")))
 
             self.reset()
             self.profile = profile
+            self._is_v2 = self._use_v2 and hasattr(profile, 'segments')
             self.totaltime = profile.get_duration()
             self.start_time = datetime.datetime.now()
-            self.wall_clock_start_time = datetime.datetime.now()
+            self.wall_clock_start_time = time.monotonic()
 
             # Restore segment-based state
             self.current_segment_index = d.get("current_segment", 0)
             self.segment_phase = d.get("segment_phase", "ramp")
-            self.segment_start_time = datetime.datetime.now()
+            self.segment_start_time = time.monotonic()
 
             # Get current temperature for segment start temp
             try:
-                for zone in self.zones:
-                    zone.temperature = zone.temp_sensor.temperature() + zone.thermocouple_offset
+                self._sample_zone_temps()
                 self.segment_start_temp = self.get_control_temperature()
             except (AttributeError, TypeError):
                 self.segment_start_temp = profile.start_temp
@@ -2026,11 +2220,12 @@ class Oven(threading.Thread):
             if self.segment_phase == 'hold':
                 # Estimate how much hold time has passed based on eta_seconds difference
                 # For simplicity, start the hold from now (conservative approach)
-                self.hold_start_time = datetime.datetime.now()
+                self.hold_start_time = time.monotonic()
                 log.info("Resuming hold phase - hold timer restarted")
 
             self.cost = d.get("cost", 0)
             self.state = "RUNNING"
+            self._wake.set()
 
             log.info("Automatic restart: resuming segment %d (%s phase)" %
                      (self.current_segment_index, self.segment_phase))
@@ -2051,19 +2246,21 @@ class Oven(threading.Thread):
     def run(self):
         while True:
             log.debug('Oven running on ' + threading.current_thread().name)
+            # new tick, take fresh sensor readings
+            self._zone_temps_time = float('-inf')
+            # monotonic time shared by the segment timers during this tick
+            self._tick_now = time.monotonic()
             if self.state == "IDLE":
                 if self.should_i_automatic_restart() == True:
                     self.automatic_restart()
                 else:
                     # Check if we should activate cooling mode
                     try:
+                        self._sample_zone_temps()
                         current_temp = self.get_control_temperature()
-                        target_temp = config.cooling_target_temp
-                        if config.temp_scale.lower() == "c":
-                            target_temp = (target_temp - 32) * 5 / 9
 
                         # Activate cooling mode if above target temp
-                        if current_temp > target_temp:
+                        if current_temp > self._cooling_target:
                             if not self.cooling_mode:
                                 self.start_cooling()
                             self.update_cooling_estimate()
@@ -2075,17 +2272,20 @@ class Oven(threading.Thread):
                     except (AttributeError, TypeError):
                         pass
                         
-                time.sleep(1)
+                # the tick schedule restarts with the next run
+                self._next_tick = None
+                self._wake.wait(self.idle_poll_interval)
+                self._wake.clear()
                 continue
             if self.state == "PAUSED":
                 # Record pause start time to freeze rate-based timers on resume
-                if not hasattr(self, '_pause_start_time') or self._pause_start_time is None:
-                    self._pause_start_time = datetime.datetime.now()
+                if self._pause_start_time is None:
+                    self._pause_start_time = time.monotonic()
                     log.info("Firing paused — timers frozen")
 
                 self.reset_if_emergency()
 
-                if getattr(config, 'use_rate_based_control', False) and hasattr(self, 'profile') and self.profile and hasattr(self.profile, 'segments'):
+                if self._is_v2:
                     # Rate-based mode: do NOT advance target or run PID.
                     # Just maintain current output off (safe idle during pause).
                     pass
@@ -2097,25 +2297,25 @@ class Oven(threading.Thread):
                     self.heat_then_cool()
                     self.reset_if_schedule_ended()
 
-                time.sleep(self.get_loop_sleep_time())
+                self.sleep_until_next_tick()
                 continue
             if self.state == "RUNNING":
                 # If resuming from pause, adjust rate-based timers to exclude paused duration
-                if hasattr(self, '_pause_start_time') and self._pause_start_time is not None:
-                    pause_duration = datetime.datetime.now() - self._pause_start_time
-                    if getattr(config, 'use_rate_based_control', False):
-                        if hasattr(self, 'segment_start_time') and self.segment_start_time:
+                if self._pause_start_time is not None:
+                    pause_duration = self._tick_now - self._pause_start_time
+                    if self._is_v2:
+                        if self.segment_start_time:
                             self.segment_start_time += pause_duration
-                        if hasattr(self, 'hold_start_time') and self.hold_start_time:
+                        if self.hold_start_time:
                             self.hold_start_time += pause_duration
-                    if self.wall_clock_start_time:
+                    if self.wall_clock_start_time is not None:
                         self.wall_clock_start_time += pause_duration
-                    log.info("Resumed from pause — timers adjusted by %.1f seconds" % pause_duration.total_seconds())
+                    log.info("Resumed from pause — timers adjusted by %.1f seconds" % pause_duration)
                     self._pause_start_time = None
 
                 # Track wall-clock time since actual start (no seek offset)
-                if self.wall_clock_start_time:
-                    self.actual_elapsed_time = (datetime.datetime.now() - self.wall_clock_start_time).total_seconds()
+                if self.wall_clock_start_time is not None:
+                    self.actual_elapsed_time = self._tick_now - self.wall_clock_start_time
                 else:
                     self.actual_elapsed_time = 0
                 
@@ -2124,7 +2324,7 @@ class Oven(threading.Thread):
                 self.save_automatic_restart_state()
                 
                 # Use segment-based or legacy control based on config
-                if getattr(config, 'use_rate_based_control', False) and hasattr(self.profile, 'segments'):
+                if self._is_v2:
                     # Segment-based control (v2)
                     self.update_segment_progress()
                     # _advance_segment may have set state to IDLE - skip remaining
@@ -2147,13 +2347,35 @@ class Oven(threading.Thread):
                     zone.target = self.target + zone.temp_offset
                 self.heat_then_cool()
                 self.reset_if_emergency()
-                time.sleep(self.get_loop_sleep_time())
+                self.sleep_until_next_tick()
 
     def get_loop_sleep_time(self):
         """Get wall-clock sleep time for the main loop.
         Override in SimulatedOven to apply speedup factor."""
         return self.time_step
 
+    def sleep_until_next_tick(self):
+        """Sleep until the next control tick is due.
+        A tick lasts its relay duty cycle plus get_loop_sleep_time() with
+        the relays off, the same cadence as a plain sleep after the tick.
+        Ticks are scheduled against monotonic deadlines, so other work in
+        the tick doesn't stretch the period and sleep jitter doesn't
+        accumulate."""
+        period = self._tick_duty + self.get_loop_sleep_time()
+        self._tick_duty = 0
+        if self._next_tick is None:
+            self._next_tick = self._tick_now
+        self._next_tick += period
+        delay = self._next_tick - time.monotonic()
+        if delay > 0:
+            # an abort or a new run wakes the loop early
+            if self._wake.wait(delay):
+                self._wake.clear()
+        elif delay < -period:
+            # more than a tick behind, start a fresh schedule rather than
+            # running a burst of ticks to catch up
+            self._next_tick = time.monotonic()
+
 class SimulatedOven(Oven):
 
     def __init__(self):
@@ -2187,6 +2409,7 @@ class SimulatedOven(Oven):
             zone.sim_t_oven = zone.temp_sensor.simulated_temperature
 
         super().__init__()
+        self.update_sim_coefficients()
 
         self.start_time = self.get_start_time();
 
@@ -2209,20 +2432,21 @@ class SimulatedOven(Oven):
 
         self.runtime = runtime_delta.total_seconds() * self.speedup_factor
         # Update actual_elapsed_time from wall clock start (no seek offset), with speedup
-        if self.wall_clock_start_time:
-            self.actual_elapsed_time = (datetime.datetime.now() - self.wall_clock_start_time).total_seconds() * self.speedup_factor
+        if self.wall_clock_start_time is not None:
+            self.actual_elapsed_time = (time.monotonic() - self.wall_clock_start_time) * self.speedup_factor
         else:
             self.actual_elapsed_time = 0
 
     def update_target_temp(self):
         """Update target temperature - uses segment-based or legacy mode"""
         # SimulatedOven MUST call update_runtime() to keep self.runtime updated
-        # for heat_then_cool() which uses self.runtime for now_simulator
+        # and actual_elapsed_time for heat_then_cool()'s now_simulator
         self.update_runtime()
         
-        if getattr(config, 'use_rate_based_control', False) and hasattr(self.profile, 'segments'):
+        if self._is_v2:
             self.target = self.calculate_rate_based_target()
             self.target_heat_rate = self.profile.get_rate_for_segment(self.current_segment_index)
+            self.target_rate_mode = self.profile.get_rate_mode_for_segment(self.current_segment_index)
         else:
             self.target = self.profile.get_target_temperature(self.runtime)
     
@@ -2234,7 +2458,7 @@ class SimulatedOven(Oven):
         Key constraint: target cannot exceed segment_start_temp + (rate * elapsed_hours)
         This ensures the kiln follows the specified rate, not its maximum heating capability.
         """
-        if not hasattr(self.profile, 'segments') or not self.profile.segments:
+        if not self.profile.segments:
             return self.profile.get_target_temperature(self.runtime)
         
         if self.current_segment_index >= len(self.profile.segments):
@@ -2247,7 +2471,7 @@ class SimulatedOven(Oven):
         
         segment = self.profile.segments[self.current_segment_index]
         
-        if segment.rate in ("max", "cool"):
+        if segment.rate_mode != RateMode.NUMERIC:
             return segment.target
         
         if segment.rate == 0:
@@ -2255,13 +2479,14 @@ class SimulatedOven(Oven):
         
         # Get current actual temperature (direct sensor read for PID accuracy)
         try:
-            actual_temp = self.zones[0].temp_sensor.temperature() + self.zones[0].thermocouple_offset
+            self._sample_zone_temps()
+            actual_temp = self.zones[0].temperature
         except (AttributeError, TypeError):
             actual_temp = self.segment_start_temp if self.segment_start_temp else 0
 
         # Calculate elapsed time since segment start (with speedup for simulation)
         if self.segment_start_time:
-            elapsed_seconds = (datetime.datetime.now() - self.segment_start_time).total_seconds() * self.speedup_factor
+            elapsed_seconds = (self._tick_now - self.segment_start_time) * self.speedup_factor
         else:
             elapsed_seconds = 0
         elapsed_hours = elapsed_seconds / 3600
@@ -2272,13 +2497,13 @@ class SimulatedOven(Oven):
         rate_based_ceiling = start_temp + (segment.rate * elapsed_hours)
         
         # Calculate lead for PID responsiveness
-        lookahead_seconds = getattr(config, 'rate_lookahead_seconds', 60)
+        lookahead_seconds = self.rate_lookahead_seconds
         effective_lookahead = min(elapsed_seconds, lookahead_seconds)
         effective_lookahead_hours = effective_lookahead / 3600
         raw_lead = segment.rate * effective_lookahead_hours
         
         # Cap the lead to prevent runaway with extreme rates
-        max_divergence = getattr(config, 'max_target_divergence', 50)
+        max_divergence = self.max_target_divergence
         if abs(raw_lead) > max_divergence:
             lead = max_divergence if raw_lead > 0 else -max_divergence
         else:
@@ -2297,33 +2522,20 @@ class SimulatedOven(Oven):
         """
         SimulatedOven override: Apply speedup_factor to hold phase timing.
         """
-        if not hasattr(self.profile, 'segments') or not self.profile.segments:
+        if not self.profile.segments:
             return
 
-        for zone in self.zones:
-            zone.temperature = zone.temp_sensor.temperature() + zone.thermocouple_offset
+        self._sample_zone_temps()
         temp = self.get_control_temperature()
         segment = self.profile.segments[self.current_segment_index]
-        tolerance = getattr(config, 'segment_complete_tolerance', 5)
         
         if self.segment_phase == 'ramp':
-            reached_target = False
-            if isinstance(segment.rate, (int, float)):
-                if segment.rate > 0:
-                    reached_target = temp >= segment.target - tolerance
-                elif segment.rate < 0:
-                    reached_target = temp <= segment.target + tolerance
-                elif segment.rate == 0:
-                    reached_target = True
-            elif segment.rate == "max":
-                reached_target = temp >= segment.target - tolerance
-            elif segment.rate == "cool":
-                reached_target = temp <= segment.target + tolerance
+            reached_target = self.profile.ramp_complete(self.current_segment_index, temp)
             
             if reached_target:
                 if segment.hold > 0:
                     self.segment_phase = 'hold'
-                    self.hold_start_time = datetime.datetime.now()
+                    self.hold_start_time = self._tick_now
                     log.info("Segment %d: reached target %.1f, starting %.1f min hold" % 
                              (self.current_segment_index, segment.target, segment.hold/60))
                 else:
@@ -2332,43 +2544,58 @@ class SimulatedOven(Oven):
         elif self.segment_phase == 'hold':
             if self.hold_start_time:
                 # Apply speedup_factor to hold elapsed time
-                hold_elapsed = (datetime.datetime.now() - self.hold_start_time).total_seconds() * self.speedup_factor
+                hold_elapsed = (self._tick_now - self.hold_start_time) * self.speedup_factor
                 if hold_elapsed >= segment.hold:
                     self._advance_segment()
 
+    def update_sim_coefficients(self):
+        '''fold each zone's thermal constants and the time_step into the
+           per-step factors used by heating_energy() and temp_changes().
+           call again after changing a zone's sim_* parameters.'''
+        dt = self.time_step
+        for zone in self.zones:
+            # temperature rise of the element per step at full power
+            zone.sim_k_heat = zone.sim_p_heat / zone.sim_c_heat * dt
+            # fraction of the element -> oven difference moved per step
+            zone.sim_k_ho_heat = dt / (zone.sim_R_ho_noair * zone.sim_c_heat)
+            zone.sim_k_ho_oven = dt / (zone.sim_R_ho_noair * zone.sim_c_oven)
+            # fraction of the oven -> environment difference lost per step
+            zone.sim_k_oe = dt / (zone.sim_R_o_nocool * zone.sim_c_oven)
+
     def heating_energy(self, zone):
         # Using zone.heat (PID output) simulates the element being on for
         # only part of the time_step. Returns energy added to heating element.
-        return zone.heat * zone.sim_p_heat / zone.sim_c_heat * self.time_step
+        return zone.heat * zone.sim_k_heat
 
     def temp_changes(self, zone):
-        dt = self.time_step
-        R_o = zone.sim_R_o_nocool
-        R_ho = zone.sim_R_ho_noair
         t_heat = zone.sim_t_heat
         t_oven = zone.sim_t_oven
-        t_env = config.sim_t_env
 
         # Energy flux: heating element -> oven
-        dQ_ho = (t_heat - t_oven) / R_ho * dt
-        t_heat -= dQ_ho / zone.sim_c_heat
-        t_oven += dQ_ho / zone.sim_c_oven
+        diff_ho = t_heat - t_oven
+        t_heat -= diff_ho * zone.sim_k_ho_heat
+        t_oven += diff_ho * zone.sim_k_ho_oven
 
         # Energy flux: oven -> environment (cooling)
-        dQ_oe = (t_oven - t_env) / R_o * dt
-        t_oven -= dQ_oe / zone.sim_c_oven
+        t_oven -= (t_oven - self.t_env) * zone.sim_k_oe
 
         return t_heat, t_oven
 
     def heat_then_cool(self):
-        now_simulator = self.start_time + datetime.timedelta(milliseconds = self.runtime * 1000)
-        target_rate = getattr(self, 'target_heat_rate', 0)
-        is_cooling_segment = (isinstance(target_rate, (int, float)) and target_rate < 0)
-        is_natural_cool = (target_rate == "cool")
+        # monotonic seconds on the sped-up clock, comparable with PID.lastNow
+        if self.wall_clock_start_time is None:
+            now_simulator = time.monotonic()
+        else:
+            now_simulator = self.wall_clock_start_time + self.actual_elapsed_time
+        rate_mode = self.target_rate_mode
+        is_cooling_segment = (rate_mode == RateMode.NUMERIC and self.target_heat_rate < 0)
+        is_natural_cool = (rate_mode == RateMode.COOL)
 
+        # same readings the rest of this tick used
+        self._sample_zone_temps()
         for zone in self.zones:
             # zone.target already set by run() loop (self.target + zone.temp_offset)
-            current_temp = zone.temp_sensor.temperature() + zone.thermocouple_offset
+            current_temp = zone.temperature
             zone_pid = zone.pid.compute(zone.target, current_temp, now_simulator)
 
             # During cooling segments: only heat if kiln is cooling too fast (temp below target)
@@ -2407,7 +2634,8 @@ class SimulatedOven(Oven):
 
         try:
             zone0 = self.zones[0] if self.zones else None
-            if zone0:
+            # skip formatting the tick summary when nobody will see it
+            if zone0 and log.isEnabledFor(logging.INFO):
                 log.info("temp=%.2f, target=%.2f, error=%.2f, pid=%.2f, p=%.2f, i=%.2f, d=%.2f, heat=%.2f, run_time=%d, total_time=%d, time_left=%d" %
                     (zone0.pid.pidstats['ispoint'],
                     zone0.pid.pidstats['setpoint'],
@@ -2445,16 +2673,18 @@ class RealOven(Oven):
             zone.output.cool(0)
 
     def heat_then_cool(self):
-        now = datetime.datetime.now()
+        now = time.monotonic()
         n = len(self.zones)
         zone_time_step = self.time_step / n
 
-        target_rate = getattr(self, 'target_heat_rate', 0)
-        is_natural_cool = (target_rate == "cool")
-        is_cooling_segment = (isinstance(target_rate, (int, float)) and target_rate < 0)
+        rate_mode = self.target_rate_mode
+        is_natural_cool = (rate_mode == RateMode.COOL)
+        is_cooling_segment = (rate_mode == RateMode.NUMERIC and self.target_heat_rate < 0)
 
+        # same readings the rest of this tick used
+        self._sample_zone_temps()
         for zone in self.zones:
-            current_temp = zone.temp_sensor.temperature() + zone.thermocouple_offset
+            current_temp = zone.temperature
             zone_pid = zone.pid.compute(zone.target, current_temp, now)
 
             # During cooling segments: only heat if kiln is cooling too fast (temp below target)
@@ -2478,10 +2708,16 @@ class RealOven(Oven):
                 zone.output.heat(heat_on)
             # Always call cool() to ensure relay state is explicit
             zone.output.cool(heat_off)
+        # the relays were driven for a whole time_step
+        self._tick_duty = self.time_step
 
         # Update oven-level heat as average for backward compat
         self.heat = sum(z.heat for z in self.zones) / n
 
+        # skip formatting the tick summary when nobody will see it
+        if not log.isEnabledFor(logging.INFO):
+            return
+
         time_left = self.totaltime - self.runtime
         try:
             zone0 = self.zones[0]
@@ -2500,8 +2736,19 @@ class RealOven(Oven):
         except KeyError:
             pass
 
+class RateMode(enum.IntEnum):
+    """How a segment's rate is interpreted"""
+    NUMERIC = 0  # degrees/hour, 0 is a pure hold
+    MAX = 1      # heat as fast as possible
+    COOL = 2     # cool naturally (no power)
+
+RATE_MODES = {"max": RateMode.MAX, "cool": RateMode.COOL}
+
 class Segment:
     """Represents a single firing segment in a rate-based profile (v2 format)"""
+
+    # profiles can have many segments and the control loop reads them every tick
+    __slots__ = ('rate', 'rate_mode', 'target', 'hold')
     
     def __init__(self, rate, target, hold=0):
         """
@@ -2518,12 +2765,22 @@ class Segment:
             hold: Hold time in minutes (stored internally as seconds)
         """
         self.rate = rate
+        # resolved once so the control loop compares ints, not strings
+        if isinstance(rate, str):
+            rate_mode = RATE_MODES.get(rate)
+            if rate_mode is None:
+                # older releases ran any other string rate as a natural cool
+                log.warning("unknown segment rate %r, treating it as \"cool\"" % rate)
+                rate_mode = RateMode.COOL
+            self.rate_mode = rate_mode
+        else:
+            self.rate_mode = RateMode.NUMERIC
         self.target = target
         self.hold = hold * 60  # Convert minutes to seconds
     
     def is_ramp(self):
         """Returns True if this segment has a ramp phase (non-zero numeric rate)"""
-        return isinstance(self.rate, (int, float)) and self.rate != 0
+        return self.rate_mode == RateMode.NUMERIC and self.rate != 0
     
     def is_pure_hold(self):
         """Returns True if this is a hold-only segment (rate=0)"""
@@ -2535,11 +2792,11 @@ class Segment:
     
     def is_max_power(self):
         """Returns True if this segment uses maximum heating rate"""
-        return self.rate == "max"
+        return self.rate_mode == RateMode.MAX
     
     def is_natural_cool(self):
         """Returns True if this segment uses natural cooling"""
-        return self.rate == "cool"
+        return self.rate_mode == RateMode.COOL
     
     def validate(self, previous_target=None):
         """
@@ -2569,19 +2826,92 @@ class Segment:
 
 class Profile():
     def __init__(self, json_data):
-        obj = json.loads(json_data)
+        obj = parse_profile_json(json_data)
         self.name = obj["name"]
         self.version = obj.get("version", 1)
         
         if self.version == 1:
             # Legacy format - load data and convert to segments
-            self.data = sorted(obj["data"])
+            self.data = list(obj["data"])
             self._load_legacy(obj)
+            self._build_segment_tables()
         else:
             # V2 format - load segments directly
             self._load_v2(obj)
+            self._build_segment_tables()
             # Generate legacy data for graph compatibility
             self.data = self.to_legacy_format()
+        # profiles don't change once loaded, data is in time order
+        self._times = list(map(operator.itemgetter(0), self.data))
+        self._temps = list(map(operator.itemgetter(1), self.data))
+        self._duration = self._times[-1] if self._times else 0
+        self._build_rising_runs()
+        # slope of the line ending at each point after the first,
+        # 0 where two points share a time
+        self._slopes = [
+            (temp2 - temp1) / (time2 - time1) if time2 != time1 else 0.0
+            for time1, temp1, time2, temp2 in zip(
+                self._times, self._temps, self._times[1:], self._temps[1:])]
+        # index of the point ending the line get_target_temperature used last
+        self._last_idx = 1
+        # (time, target) of the last query, runtime stands still while paused
+        self._last_target = (None, None)
+        self._estimated_duration = None
+
+    def _build_segment_tables(self):
+        """
+        Precompute per-segment timing used every control tick.
+
+        seconds_per_degree: seconds to ramp one degree at the segment's rate
+                            (estimated rates for "max" and "cool", 0 for holds)
+        hold_seconds: hold time of each segment in seconds
+        """
+        max_rate = getattr(config, 'estimated_max_heating_rate', 500)
+        cool_rate = getattr(config, 'estimated_natural_cooling_rate', 100)
+        self.seconds_per_degree = []
+        for segment in self.segments:
+            rate_mode = segment.rate_mode
+            if rate_mode == RateMode.MAX:
+                self.seconds_per_degree.append(3600 / max_rate)
+            elif rate_mode == RateMode.COOL:
+                self.seconds_per_degree.append(3600 / cool_rate)
+            elif segment.rate != 0:
+                self.seconds_per_degree.append(3600 / abs(segment.rate))
+            else:
+                self.seconds_per_degree.append(0)
+        self.hold_seconds = [segment.hold for segment in self.segments]
+
+        # A ramp is complete once direction * temp >= bound. direction is 1
+        # for heating, -1 for cooling and 0 for pure holds, which are
+        # always complete.
+        tolerance = getattr(config, 'segment_complete_tolerance', 5)
+        self.completion = []
+        for segment in self.segments:
+            rate_mode = segment.rate_mode
+            if rate_mode == RateMode.MAX:
+                direction = 1
+            elif rate_mode == RateMode.COOL:
+                direction = -1
+            elif segment.rate > 0:
+                direction = 1
+            elif segment.rate < 0:
+                direction = -1
+            else:
+                direction = 0
+            bound = direction * (segment.target - tolerance * direction)
+            self.completion.append((direction, bound))
+
+        # to_legacy_format results by (start_temp, from_segment)
+        self._legacy_cache = {}
+
+    def ramp_complete(self, index, temp):
+        """True once temp is within tolerance of the target of segment index"""
+        direction, bound = self.completion[index]
+        return direction * temp >= bound
+
+    def ramp_seconds(self, index, from_temp):
+        """Estimated seconds to ramp from from_temp to the target of segment index"""
+        return abs(self.segments[index].target - from_temp) * self.seconds_per_degree[index]
     
     def _load_legacy(self, obj):
         """Convert legacy time-based format to segments"""
@@ -2621,24 +2951,28 @@ class Profile():
         needs_c_to_f = self.temp_units == "c" and config.temp_scale.lower() == "f"
         needs_f_to_c = self.temp_units == "f" and config.temp_scale.lower() == "c"
         
+        # Pick the conversions once for the whole profile
         if needs_c_to_f:
-            self.start_temp = (self.start_temp * 9 / 5) + 32
+            convert_temp = lambda t: (t * 9 / 5) + 32
+            convert_rate = lambda r: r * 9 / 5  # Rate conversion: °C/hr to °F/hr
         elif needs_f_to_c:
-            self.start_temp = (self.start_temp - 32) * 5 / 9
+            convert_temp = lambda t: (t - 32) * 5 / 9
+            convert_rate = lambda r: r * 5 / 9  # Rate conversion: °F/hr to °C/hr
+        else:
+            convert_temp = convert_rate = None
+
+        if convert_temp:
+            self.start_temp = convert_temp(self.start_temp)
         
         for seg in obj.get("segments", []):
             target = seg["target"]
             rate = seg["rate"]
             
-            # Convert temperatures and rates if needed
-            if needs_c_to_f:
-                target = (target * 9 / 5) + 32
-                if isinstance(rate, (int, float)):
-                    rate = rate * 9 / 5  # Rate conversion: °C/hr to °F/hr
-            elif needs_f_to_c:
-                target = (target - 32) * 5 / 9
-                if isinstance(rate, (int, float)):
-                    rate = rate * 5 / 9  # Rate conversion: °F/hr to °C/hr
+            # Convert temperatures and rates if needed ("max"/"cool" stay as is)
+            if convert_temp:
+                target = convert_temp(target)
+                if type(rate) is not str:
+                    rate = convert_rate(rate)
             
             segment = Segment(
                 rate=rate,
@@ -2663,47 +2997,40 @@ class Profile():
                           already-completed segments that would create a dip.
 
         Returns:
-            list: Array of [time_seconds, temperature] tuples
+            list: Array of [time_seconds, temperature] tuples, shared
+                  between callers so it must not be modified
         """
         if start_temp is None:
             start_temp = self.start_temp
 
+        key = (start_temp, from_segment)
+        data = self._legacy_cache.get(key)
+        if data is not None:
+            return data
+
         data = [[0, start_temp]]
         current_time = 0
         current_temp = start_temp
 
-        for segment in self.segments[from_segment:]:
-            if isinstance(segment.rate, str):
-                # Estimate time for special rates
-                if segment.rate == "max":
-                    temp_diff = segment.target - current_temp
-                    # Use estimated max heating rate from config
-                    max_rate = getattr(config, 'estimated_max_heating_rate', 500)
-                    time_seconds = abs(temp_diff) / max_rate * 3600
-                else:  # "cool"
-                    temp_diff = current_temp - segment.target
-                    # Use estimated natural cooling rate from config
-                    cool_rate = getattr(config, 'estimated_natural_cooling_rate', 100)
-                    time_seconds = abs(temp_diff) / cool_rate * 3600
-                # Add ramp point for special rates
-                current_time += time_seconds
-                current_temp = segment.target
-                data.append([current_time, current_temp])
-            elif segment.rate != 0:
-                # Normal ramp segment
-                temp_diff = segment.target - current_temp
-                time_hours = abs(temp_diff) / abs(segment.rate)
-                time_seconds = time_hours * 3600
-                current_time += time_seconds
+        # walk the precomputed tables in step with the segments
+        append = data.append
+        for segment, seconds_per_degree, hold in zip(
+                self.segments[from_segment:],
+                self.seconds_per_degree[from_segment:],
+                self.hold_seconds[from_segment:]):
+            if seconds_per_degree:
+                # Ramp segment, "max" and "cool" use the estimated rates from config
+                current_time += abs(segment.target - current_temp) * seconds_per_degree
                 current_temp = segment.target
-                data.append([current_time, current_temp])
+                append([current_time, current_temp])
             # For rate=0 (pure hold), don't add a ramp point - just add the hold below
             
             # Add hold point if needed (applies to all segment types)
-            if segment.hold > 0:
-                current_time += segment.hold
-                data.append([current_time, current_temp])
+            if hold > 0:
+                current_time += hold
+                append([current_time, current_temp])
         
+        self._legacy_cache[key] = data
         return data
     
     def estimate_duration(self, start_temp=None):
@@ -2715,27 +3042,17 @@ class Profile():
             float: Estimated duration in seconds
         """
         if start_temp is None:
-            start_temp = self.start_temp
+            if self._estimated_duration is None:
+                self._estimated_duration = self.estimate_duration(self.start_temp)
+            return self._estimated_duration
         
         total_seconds = 0
         current_temp = start_temp
         
-        for segment in self.segments:
-            if isinstance(segment.rate, str):
-                # Can't estimate "max" or "cool" accurately
-                if segment.rate == "max":
-                    max_rate = getattr(config, 'estimated_max_heating_rate', 500)
-                    temp_diff = abs(segment.target - current_temp)
-                    total_seconds += (temp_diff / max_rate) * 3600
-                elif segment.rate == "cool":
-                    cool_rate = getattr(config, 'estimated_natural_cooling_rate', 100)
-                    temp_diff = abs(current_temp - segment.target)
-                    total_seconds += (temp_diff / cool_rate) * 3600
-            elif segment.rate != 0:
-                temp_diff = abs(segment.target - current_temp)
-                time_hours = temp_diff / abs(segment.rate)
-                total_seconds += time_hours * 3600
-            
+        for index, segment in enumerate(self.segments):
+            # "max" and "cool" can't be estimated accurately, they use
+            # the estimated rates from config
+            total_seconds += self.ramp_seconds(index, current_temp)
             total_seconds += segment.hold  # Add hold time
             current_temp = segment.target
         
@@ -2758,23 +3075,9 @@ class Profile():
         segment = self.segments[segment_index]
         
         # Check if we've reached the target for this segment
-        tolerance = getattr(config, 'segment_complete_tolerance', 5)
-        
-        if segment.rate == 0:  # Explicit hold segment
+        # (explicit hold segments always have)
+        if self.ramp_complete(segment_index, current_temp):
             return (segment_index, segment, 'hold')
-        elif segment.rate == "max":
-            if current_temp >= segment.target - tolerance:
-                return (segment_index, segment, 'hold')
-        elif segment.rate == "cool":
-            if current_temp <= segment.target + tolerance:
-                return (segment_index, segment, 'hold')
-        elif isinstance(segment.rate, (int, float)):
-            if segment.rate > 0:  # Heating
-                if current_temp >= segment.target - tolerance:
-                    return (segment_index, segment, 'hold')
-            elif segment.rate < 0:  # Cooling
-                if current_temp <= segment.target + tolerance:
-                    return (segment_index, segment, 'hold')
         
         return (segment_index, segment, 'ramp')
     
@@ -2795,8 +3098,9 @@ class Profile():
         tolerance = getattr(config, 'segment_complete_tolerance', 5)
 
         for i, segment in enumerate(self.segments):
-            is_heating = (isinstance(segment.rate, (int, float)) and segment.rate > 0) or segment.rate == "max"
-            is_cooling = (isinstance(segment.rate, (int, float)) and segment.rate < 0) or segment.rate == "cool"
+            rate_mode = segment.rate_mode
+            is_heating = rate_mode == RateMode.MAX or (rate_mode == RateMode.NUMERIC and segment.rate > 0)
+            is_cooling = rate_mode == RateMode.COOL or (rate_mode == RateMode.NUMERIC and segment.rate < 0)
 
             if is_heating or segment.rate == 0:
                 # Heating or hold segment: skip if kiln is already at or above target
@@ -2824,6 +3128,12 @@ class Profile():
             return 0
         return self.segments[segment_index].rate
     
+    def get_rate_mode_for_segment(self, segment_index):
+        """Get the RateMode for current segment"""
+        if segment_index >= len(self.segments):
+            return RateMode.NUMERIC
+        return self.segments[segment_index].rate_mode
+    
     def get_hold_duration(self, segment_index):
         """Get hold duration in seconds for segment"""
         if segment_index >= len(self.segments):
@@ -2831,7 +3141,7 @@ class Profile():
         return self.segments[segment_index].hold
 
     def get_duration(self):
-        return max([t for (t, x) in self.data])
+        return self._duration
 
     #  x = (y-y1)(x2-x1)/(y2-y1) + x1
     @staticmethod
@@ -2863,26 +3173,41 @@ class Profile():
         x = (y - point1[1]) * (point2[0] - point1[0]) / (point2[1] - point1[1]) + point1[0]
         return x
 
+    def _build_rising_runs(self):
+        """
+        Split the data into runs of points whose temperature never drops.
+        A temperature can only be crossed going up inside one of these runs,
+        and each run is sorted by temperature so it can be bisected.
+
+        _rising_runs: list of (index of first point, temperatures of the run)
+        """
+        self._rising_runs = []
+        start = 0
+        for index in range(1, len(self.data) + 1):
+            if index == len(self.data) or self.data[index][1] < self.data[index - 1][1]:
+                if index - start > 1:
+                    self._rising_runs.append(
+                        (start, [point[1] for point in self.data[start:index]]))
+                start = index
+
     def find_next_time_from_temperature(self, temperature):
         """Find the time when temperature is reached in the profile"""
-        time = 0  # Default if no intersection found
-        for index, point2 in enumerate(self.data):
-            if point2[1] >= temperature:
-                if index > 0:
-                    if self.data[index - 1][1] <= temperature:
-                        result = self.find_x_given_y_on_line_from_two_points(
-                            temperature, self.data[index - 1], point2)
-                        
-                        # Check for None instead of 0
-                        if result is not None:
-                            time = result
-                            break
-                        elif self.data[index - 1][1] == point2[1]:
-                            # Flat segment that matches temperature
-                            time = self.data[index - 1][0]
-                            break
-                        # else: result is None (error), keep time=0
-        return time
+        for start, temps in self._rising_runs:
+            if not temps[0] <= temperature <= temps[-1]:
+                continue
+            # first point of the run at or above temperature, paired with
+            # the point before it
+            index = start + max(bisect.bisect_left(temps, temperature), 1)
+            point1 = self.data[index - 1]
+            point2 = self.data[index]
+            result = self.find_x_given_y_on_line_from_two_points(
+                temperature, point1, point2)
+            if result is not None:
+                return result
+            if point1[1] == point2[1]:
+                # Flat segment that matches temperature
+                return point1[0]
+        return 0  # Default if no intersection found
 
     def get_surrounding_points(self, time):
         if time > self.get_duration():
@@ -2896,34 +3221,59 @@ class Profile():
                 # Single point profile
                 return (self.data[0], self.data[0])
 
-        prev_point = None
-        next_point = None
+        # first point later than time
+        i = bisect.bisect_right(self._times, time)
+        return (self.data[i-1], self.data[i])
 
-        for i in range(len(self.data)):
-            if time < self.data[i][0]:
-                prev_point = self.data[i-1]
-                next_point = self.data[i]
-                break
+    def get_target_temperature(self, time):
+        last_time, last_target = self._last_target
+        if time == last_time:
+            return last_target
+        temp = self._interpolate_target(time)
+        self._last_target = (time, temp)
+        return temp
 
-        return (prev_point, next_point)
+    def _interpolate_target(self, time):
+        times = self._times
+        temps = self._temps
+
+        # consecutive ticks almost always fall on the same line
+        i = self._last_idx
+        if 0 < i < len(times) and times[i-1] <= time < times[i]:
+            return temps[i-1] + (time - times[i-1]) * self._slopes[i-1]
 
-    def get_target_temperature(self, time):
         if time > self.get_duration():
             return 0
 
-        (prev_point, next_point) = self.get_surrounding_points(time)
-        
-        # Defensive check - should never happen with above fix
-        if prev_point is None or next_point is None:
-            log.error("get_surrounding_points returned None for time=%s" % time)
-            return 0
+        # same points as get_surrounding_points, worked on the
+        # time and temperature tables directly
+        if time >= times[-1]:
+            if len(times) < 2:
+                # Single point profile
+                return temps[0]
+            i = len(times) - 1
+        else:
+            i = self._last_idx
+            if 0 < i < len(times) and times[i-1] <= time:
+                # time moves forward, usually onto the next line
+                while time >= times[i]:
+                    i += 1
+            else:
+                i = bisect.bisect_right(times, time)
+            self._last_idx = i
+        prev_time = times[i-1]
+        next_time = times[i]
         
         # Handle identical points (flat segment at end)
-        if next_point[0] == prev_point[0]:
-            return prev_point[1]
+        if next_time == prev_time:
+            return temps[i-1]
 
-        incl = float(next_point[1] - prev_point[1]) / float(next_point[0] - prev_point[0])
-        temp = prev_point[1] + (time - prev_point[0]) * incl
+        if i == 0:
+            # before the first point, on the line from the last point
+            incl = (temps[0] - temps[-1]) / (next_time - prev_time)
+        else:
+            incl = self._slopes[i-1]
+        temp = temps[i-1] + (time - prev_time) * incl
         return temp
 
 
@@ -2933,7 +3283,8 @@ class PID():
         self.ki = ki
         self.kp = kp
         self.kd = kd
-        self.lastNow = datetime.datetime.now()
+        self.inv_ki = 1 / ki
+        self.lastNow = time.monotonic()
         self.iterm = 0
         self.lastErr = 0
         self.pidstats = {}
@@ -2944,7 +3295,7 @@ class PID():
     # in a larger PID control window and much more accurate control...
     # instead of what used to be binary on/off control.
     def compute(self, setpoint, ispoint, now):
-        timeDelta = (now - self.lastNow).total_seconds()
+        timeDelta = now - self.lastNow
         if timeDelta <= 0:
             timeDelta = 0.001  # Guard against zero/negative timeDelta on first call
 
@@ -2960,6 +3311,9 @@ class PID():
         output = 0
         out4logs = 0
         dErr = 0
+        # proportional term, also reported in pidstats outside the window
+        p_term = self.kp * error
+        d_term = 0
         if error < (-1 * config.pid_control_window):
             log.info("kiln outside pid control window, max cooling")
             output = 0
@@ -2981,21 +3335,18 @@ class PID():
                     output = config.throttle_percent/100
                     log.info("max heating throttled at %d percent below %d degrees to prevent overshoot" % (config.throttle_percent,config.throttle_below_temp))
         else:
-            # Proportional term
-            p_term = self.kp * error
-            
             # Derivative term
             dErr = (error - self.lastErr) / timeDelta
             d_term = self.kd * dErr
             
             # Calculate integral contribution (but don't add to iterm yet)
-            i_contribution = error * timeDelta * (1/self.ki)
+            i_contribution = error * timeDelta * self.inv_ki
             
             # Calculate output before clamping
             output_unclamped = p_term + self.iterm + d_term
             
             # Clamp output to limits
-            output = sorted([-1 * window_size, output_unclamped, window_size])[1]
+            output = max(-window_size, min(window_size, output_unclamped))
             
             # Anti-windup: Only accumulate integral if output is not saturated
             # This prevents integral windup during saturation
@@ -3017,15 +3368,15 @@ class PID():
             output = 0
 
         self.pidstats = {
-            'time': time.mktime(now.timetuple()),
+            'time': time.time(),
             'timeDelta': timeDelta,
             'setpoint': setpoint,
             'ispoint': ispoint,
             'err': error,
             'errDelta': dErr,
-            'p': self.kp * error,
+            'p': p_term,
             'i': self.iterm,
-            'd': self.kd * dErr,
+            'd': d_term,
             'kp': self.kp,
             'ki': self.ki,
             'kd': self.kd,
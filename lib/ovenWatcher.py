@@ -1,16 +1,31 @@
-import threading,logging,json,time,datetime
-from oven import Oven
+import threading,logging,time,datetime
+from oven import Oven, dumps_message
 log = logging.getLogger(__name__)
 
 class OvenWatcher(threading.Thread):
     def __init__(self,oven):
         self.last_profile = None
         self.last_log = []
+        # once a firing has logged this many states, every other one is
+        # dropped and only every 2nd (then 4th, ...) new state is kept, so a
+        # long firing stays bounded but still covers the whole run
+        self.last_log_max = 3600
+        self.log_every = 1
+        self.log_skipped = 0
         self.started = None
         self.recording = False
         self.observers = []
+        # held while the observer list is changed, clients join from the
+        # server thread while broadcasts prune it from this one
+        self.observers_lock = threading.Lock()
         self.adjusted_profile_data = None
+        # serialized backlog profile and the (profile, data) it was made from
+        self.profile_json = 'null'
+        self.profile_json_source = (None, None)
         self.mqtt_client = None
+        self.last_fingerprint = None
+        self.quiet_ticks = 0
+        self.heartbeat_ticks = 10
         threading.Thread.__init__(self)
         self.daemon = True
         self.oven = oven
@@ -26,16 +41,68 @@ class OvenWatcher(threading.Thread):
 
     def run(self):
         while True:
+            # an idle kiln nobody is watching has nothing to record or send,
+            # so skip sampling and serializing its state
+            if self.oven.state == "IDLE" and not self.has_listeners():
+                self.recording = False
+                time.sleep(self.oven.time_step)
+                continue
+
             oven_state = self.oven.get_state()
            
             # record state for any new clients that join
             if oven_state.get("state") == "RUNNING":
-                self.last_log.append(oven_state)
+                self.log_state(oven_state)
             else:
                 self.recording = False
-            self.notify_all(oven_state)
+
+            self.broadcast_state(oven_state)
             time.sleep(self.oven.time_step)
 
+    def broadcast_state(self,state):
+        '''send a state to the clients. A running firing is sent every tick.
+        An idle or paused kiln whose state looks the same as the last one
+        sent is only sent every heartbeat_ticks ticks, mqtt still gets
+        every state.'''
+        fingerprint = None
+        if state.get('state') != "RUNNING":
+            fingerprint = self.state_fingerprint(state)
+            self.quiet_ticks += 1
+            if fingerprint == self.last_fingerprint and self.quiet_ticks < self.heartbeat_ticks:
+                if self.mqtt_client:
+                    self.mqtt_client.publish_state(state)
+                return
+        self.last_fingerprint = fingerprint
+        self.quiet_ticks = 0
+        self.notify_all(state)
+
+    def state_fingerprint(self,state):
+        '''the parts of a state a client would notice changing'''
+        return (state.get('state'),
+                round(state.get('temperature') or 0, 1),
+                round(state.get('target') or 0, 1),
+                round(state.get('heat') or 0, 2),
+                round(state.get('runtime') or 0),
+                state.get('totaltime'),
+                tuple(round(zone.get('temperature') or 0, 1)
+                      for zone in state.get('zones', ())),
+                state.get('emergency'),
+                state.get('profile'),
+                state.get('current_segment'),
+                state.get('segment_phase'),
+                state.get('eta_seconds'),
+                state.get('cooling_estimate'))
+
+    def log_state(self,state):
+        self.log_skipped += 1
+        if self.log_skipped < self.log_every:
+            return
+        self.log_skipped = 0
+        self.last_log.append(state)
+        if len(self.last_log) > self.last_log_max:
+            self.last_log = self.last_log[::2]
+            self.log_every *= 2
+
     def lastlog_subset(self,maxpts=50):
         '''send about maxpts from lastlog by skipping unwanted data'''
         totalpts = len(self.last_log)
@@ -47,6 +114,9 @@ class OvenWatcher(threading.Thread):
     def record(self, profile):
         self.last_profile = profile
         self.last_log = []
+        self.log_every = 1
+        self.log_skipped = 0
+        self.last_fingerprint = None
         self.started = datetime.datetime.now()
         self.recording = True
         #we just turned on, add first state for nice graph
@@ -62,7 +132,7 @@ class OvenWatcher(threading.Thread):
         if hasattr(profile, 'segments') and profile.segments:
             self.adjusted_profile_data = profile.to_legacy_format(start_temp=actual_temp, from_segment=from_segment)
         elif profile.data and len(profile.data) > 0:
-            self.adjusted_profile_data = [[0, actual_temp]] + [list(pt) for pt in profile.data[1:]]
+            self.adjusted_profile_data = [[0, actual_temp]] + profile.data[1:]
         else:
             self.adjusted_profile_data = profile.data
         
@@ -72,51 +142,66 @@ class OvenWatcher(threading.Thread):
             'data': self.adjusted_profile_data
         }
         self.notify_all(profile_update)
+        self.backlog_profile_json()
 
     def add_observer(self,observer):
-        if self.last_profile:
-            # During an active firing, send the adjusted profile curve;
-            # otherwise send the original profile data.
-            if self.recording and self.adjusted_profile_data:
-                profile_data = self.adjusted_profile_data
-            else:
-                profile_data = self.last_profile.data
-            p = {
-                "name": self.last_profile.name,
-                "data": profile_data,
-                "type" : "profile"
-            }
-        else:
-            p = None
-        
-        log_subset = self.lastlog_subset()
-        backlog = {
-            'type': "backlog",
-            'profile': p,
-            'log': log_subset,
-        }
-        
-        backlog_json = json.dumps(backlog)
+        if not observer:
+            return
+        # the backlog is assembled by hand so the profile curve, which is
+        # the same for every client, is only serialized once
+        backlog_json = '{"type": "backlog", "profile": %s, "log": %s}' % (
+            self.backlog_profile_json(), dumps_message(self.lastlog_subset()))
         try:
             observer.send(backlog_json)
         except:
             log.error("Could not send backlog to new observer")
         
-        self.observers.append(observer)
+        with self.observers_lock:
+            self.observers.append(observer)
+
+    def backlog_profile_json(self):
+        '''serialized profile for the backlog, reused until the curve changes'''
+        if not self.last_profile:
+            return 'null'
+        # During an active firing, send the adjusted profile curve;
+        # otherwise send the original profile data.
+        if self.recording and self.adjusted_profile_data:
+            profile_data = self.adjusted_profile_data
+        else:
+            profile_data = self.last_profile.data
+        profile, data = self.profile_json_source
+        if profile is not self.last_profile or data is not profile_data:
+            self.profile_json = dumps_message({
+                "name": self.last_profile.name,
+                "data": profile_data,
+                "type" : "profile"
+            })
+            self.profile_json_source = (self.last_profile, profile_data)
+        return self.profile_json
+
+    def has_listeners(self):
+        '''True if any websocket client or mqtt is receiving state'''
+        return bool(self.observers) or self.mqtt_client is not None
 
     def notify_all(self,message):
-        message_json = json.dumps(message)
-        log.debug("sending to %d clients: %s"%(len(self.observers),message_json))
-
-        for wsock in self.observers[:]:
-            if wsock:
-                try:
-                    wsock.send(message_json)
-                except Exception as e:
-                    log.error("could not write to socket %s: %s" % (wsock, e))
-                    self.observers.remove(wsock)
-            else:
-                self.observers.remove(wsock)
+        # clients can join from the server thread at any time, so work on
+        # one snapshot of the list throughout
+        observers = list(self.observers)
+        if observers:
+            message_json = dumps_message(message)
+            log.debug("sending to %d clients: %s"%(len(observers),message_json))
+
+        dead = set()
+        for wsock in observers:
+            try:
+                wsock.send(message_json)
+            except Exception as e:
+                log.error("could not write to socket %s: %s" % (wsock, e))
+                dead.add(id(wsock))
+        # drop closed sockets in one pass instead of a remove() per socket
+        if dead:
+            with self.observers_lock:
+                self.observers[:] = [w for w in self.observers if id(w) not in dead]
 
         if self.mqtt_client and isinstance(message, dict):
             self.mqtt_client.publish_state(message)
@@ -9,15 +9,46 @@ Options:
     --dry-run   Show changes without writing
     --backup    Create backups before modifying
     --profile-dir PATH   Profile directory (default: storage/profiles)
+    --jobs N    Worker processes (default: one per CPU)
 """
 
 import json
 import os
 import sys
 import argparse
+import multiprocessing
 import shutil
 from datetime import datetime
 
+# orjson is optional and formats the converted profiles much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_profile(profile):
+    """Serialize a profile to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(profile, option=orjson.OPT_INDENT_2)
+    return json.dumps(profile, indent=2).encode('utf-8')
+
+
+def write_profile(filepath, profile):
+    """Write a profile through a temp file so a crash never leaves half a file"""
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(dumps_profile(profile))
+    os.replace(tmp_path, filepath)
+
+
+def link_or_copy(src, dst):
+    """Hard-link a file for the backup, copying if the filesystem can't link"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 def convert_v1_to_v2(profile):
     """Convert a v1 time-based profile to v2 rate-based format"""
@@ -31,10 +62,7 @@ def convert_v1_to_v2(profile):
     segments = []
     start_temp = data[0][1]
     
-    for i in range(1, len(data)):
-        prev_time, prev_temp = data[i-1]
-        curr_time, curr_temp = data[i]
-        
+    for (prev_time, prev_temp), (curr_time, curr_temp) in zip(data, data[1:]):
         time_diff = curr_time - prev_time  # seconds
         temp_diff = curr_temp - prev_temp  # degrees
         
@@ -71,6 +99,41 @@ def convert_v1_to_v2(profile):
     }
 
 
+def migrate_profile(job):
+    """Convert one profile file; returns (stats key, report text)"""
+    filepath, dry_run = job
+    filename = os.path.basename(filepath)
+    
+    try:
+        with open(filepath, 'r') as f:
+            profile = json.load(f)
+        
+        if profile.get("version", 1) >= 2:
+            return "skipped_v2", f"SKIP (already v2): {filename}"
+        
+        converted = convert_v1_to_v2(profile)
+        if converted is None:
+            return "errors", f"ERROR (invalid): {filename}"
+        
+        if dry_run:
+            lines = [f"WOULD CONVERT: {filename}",
+                     f"  Start temp: {converted['start_temp']}",
+                     f"  Segments: {len(converted['segments'])}"]
+            for i, seg in enumerate(converted['segments']):
+                hold_str = f", hold={seg['hold']}min" if seg['hold'] > 0 else ""
+                lines.append(f"    {i+1}: rate={seg['rate']}°/hr, target={seg['target']}{hold_str}")
+            lines.append("")
+            return "converted", "\n".join(lines)
+        
+        write_profile(filepath, converted)
+        return "converted", f"CONVERTED: {filename}"
+    
+    except json.JSONDecodeError as e:
+        return "errors", f"ERROR (JSON): {filename} - {e}"
+    except Exception as e:
+        return "errors", f"ERROR: {filename} - {e}"
+
+
 def main():
     parser = argparse.ArgumentParser(description='Migrate profiles to v2 format')
     parser.add_argument('--dry-run', action='store_true', 
@@ -79,6 +142,8 @@ def main():
                         help='Create backups before modifying')
     parser.add_argument('--profile-dir', default=None, 
                         help='Profile directory')
+    parser.add_argument('--jobs', type=int, default=None, 
+                        help='Worker processes (default: one per CPU)')
     args = parser.parse_args()
     
     # Determine profile directory
@@ -103,7 +168,9 @@ def main():
     if args.backup and not args.dry_run:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_dir = os.path.join(os.path.dirname(profile_dir), f"profiles_backup_{timestamp}")
-        shutil.copytree(profile_dir, backup_dir)
+        # profiles are replaced by rename, never rewritten in place, so hard
+        # links keep the original contents
+        shutil.copytree(profile_dir, backup_dir, copy_function=link_or_copy)
         print(f"Backup created: {backup_dir}")
         print("-" * 60)
     
@@ -115,50 +182,23 @@ def main():
         "total": 0
     }
     
-    # Process each profile
-    for filename in sorted(os.listdir(profile_dir)):
-        if not filename.endswith('.json'):
-            continue
-        
+    filepaths = [os.path.join(profile_dir, filename)
+                 for filename in sorted(os.listdir(profile_dir))
+                 if filename.endswith('.json')]
+    
+    # Profiles are independent, so convert them in parallel; results come
+    # back in file order so the report reads the same as a serial run
+    jobs = [(filepath, args.dry_run) for filepath in filepaths]
+    if args.jobs == 1 or len(jobs) < 2:
+        results = [migrate_profile(job) for job in jobs]
+    else:
+        with multiprocessing.Pool(args.jobs) as pool:
+            results = pool.map(migrate_profile, jobs)
+    
+    for status, output in results:
         stats["total"] += 1
-        filepath = os.path.join(profile_dir, filename)
-        
-        try:
-            with open(filepath, 'r') as f:
-                profile = json.load(f)
-            
-            if profile.get("version", 1) >= 2:
-                print(f"SKIP (already v2): {filename}")
-                stats["skipped_v2"] += 1
-                continue
-            
-            converted = convert_v1_to_v2(profile)
-            if converted is None:
-                print(f"ERROR (invalid): {filename}")
-                stats["errors"] += 1
-                continue
-            
-            if args.dry_run:
-                print(f"WOULD CONVERT: {filename}")
-                print(f"  Start temp: {converted['start_temp']}")
-                print(f"  Segments: {len(converted['segments'])}")
-                for i, seg in enumerate(converted['segments']):
-                    hold_str = f", hold={seg['hold']}min" if seg['hold'] > 0 else ""
-                    print(f"    {i+1}: rate={seg['rate']}°/hr, target={seg['target']}{hold_str}")
-                print()
-                stats["converted"] += 1
-            else:
-                with open(filepath, 'w') as f:
-                    json.dump(converted, f, indent=2)
-                print(f"CONVERTED: {filename}")
-                stats["converted"] += 1
-        
-        except json.JSONDecodeError as e:
-            print(f"ERROR (JSON): {filename} - {e}")
-            stats["errors"] += 1
-        except Exception as e:
-            print(f"ERROR: {filename} - {e}")
-            stats["errors"] += 1
+        stats[status] += 1
+        print(output)
     
     # Print summary
     print("-" * 60)